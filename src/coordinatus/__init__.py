@@ -2,9 +2,10 @@
 
 # Import main classes and functions for convenient access
 from .types import CoordinateKind
-from .frame import Frame, create_frame
+from .frame import ABSOLUTE_FRAME, Frame, create_frame
 from . import transforms  # allows access to `coordinatus.transforms.translate2D(1, 2)``
-from .coordinate import Coordinate, Point, Vector, transform_coordinate
+from .precision import get_precision, set_precision
+from .coordinate import Coordinate, Point, Vector, transform_coordinate, transform_point, transform_vector
 
 # Visualization is optional - only available if matplotlib is installed
 try:
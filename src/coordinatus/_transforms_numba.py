@@ -0,0 +1,329 @@
+"""Optional Numba-compiled kernels for small transformation hot paths.
+
+Numba is an optional dependency. When it is installed, the kernels below are
+compiled ahead of time (explicit signatures, cached on disk) and `_HAS_NUMBA` is
+True. Otherwise callers fall back to the pure Python/numpy implementations.
+
+Install with: pip install coordinatus[numba]
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange, types
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    _HAS_NUMBA = False
+    prange = range
+
+    def get_num_threads() -> int:
+        return 1
+
+
+# sin and cos of a double near a multiple of pi/2 are off by about this much times the angle
+_ANGLE_EPS = float(np.finfo(np.float64).eps)
+# Beyond this, the residual is no longer a rounding error worth snapping: with huge angles,
+# a relative tolerance would zero genuine values, or both cos and sin
+_ANGLE_SNAP_MAX = 1e-9
+
+
+def _cos_sin(angle_rad: float) -> tuple[float, float]:
+    """Returns (cos, sin) of an angle, exact at multiples of pi/2.
+
+    The double nearest to k * pi/2 is not exactly k * pi/2, so its cosine or sine is a
+    residual such as 6.1e-17 instead of 0. Values within rounding error of the angle
+    are snapped to 0; genuinely small values, e.g. sin of a tiny angle, are kept.
+    Infinite angles give NaN, like np.cos, instead of raising like math.cos.
+    """
+    if not math.isfinite(angle_rad):
+        return math.nan, math.nan
+    c = math.cos(angle_rad)
+    s = math.sin(angle_rad)
+    tolerance = min(_ANGLE_EPS * abs(angle_rad), _ANGLE_SNAP_MAX)
+    if abs(c) <= tolerance:
+        c = 0.0
+    if abs(s) <= tolerance:
+        s = 0.0
+    return c, s
+
+
+def _apply_point_2d(m: np.ndarray, x: float, y: float) -> tuple[float, float]:
+    """Applies a 3x3 homogeneous matrix to the point (x, y, 1).
+
+    Affine matrices are applied as linear part plus translation: the weight stays 1,
+    so it is neither computed nor divided by.
+    """
+    xt = m[0, 0] * x + m[0, 1] * y + m[0, 2]
+    yt = m[1, 0] * x + m[1, 1] * y + m[1, 2]
+    if m[2, 0] == 0.0 and m[2, 1] == 0.0 and m[2, 2] == 1.0:
+        return xt, yt
+    w = m[2, 0] * x + m[2, 1] * y + m[2, 2]
+    if w != 0.0:
+        xt /= w
+        yt /= w
+    return xt, yt
+
+
+def _apply_vector_2d(m: np.ndarray, x: float, y: float) -> tuple[float, float]:
+    """Applies a 3x3 homogeneous matrix to the vector (x, y, 0).
+
+    Affine matrices only apply their linear part: the weight stays 0.
+    """
+    xt = m[0, 0] * x + m[0, 1] * y
+    yt = m[1, 0] * x + m[1, 1] * y
+    if m[2, 0] == 0.0 and m[2, 1] == 0.0:
+        return xt, yt
+    w = m[2, 0] * x + m[2, 1] * y
+    if w != 0.0:
+        xt /= w
+        yt /= w
+    return xt, yt
+
+
+def _trs2D_into(tx: float, ty: float, angle_rad: float, sx: float, sy: float, out: np.ndarray) -> None:
+    """Writes the closed-form T @ R @ S matrix into a preallocated 3x3 buffer."""
+    c, s = cos_sin(angle_rad)
+    out[0, 0] = sx * c
+    out[0, 1] = -sy * s
+    out[0, 2] = tx
+    out[1, 0] = sx * s
+    out[1, 1] = sy * c
+    out[1, 2] = ty
+    out[2, 0] = 0.0
+    out[2, 1] = 0.0
+    out[2, 2] = 1.0
+
+
+def _trks2D_into(tx: float, ty: float, angle_rad: float, kx: float, ky: float,
+                 sx: float, sy: float, out: np.ndarray) -> None:
+    """Writes the closed-form T @ R @ K @ S matrix into a preallocated 3x3 buffer."""
+    c, s = cos_sin(angle_rad)
+    out[0, 0] = sx * (c - s * ky)
+    out[0, 1] = sy * (c * kx - s)
+    out[0, 2] = tx
+    out[1, 0] = sx * (s + c * ky)
+    out[1, 1] = sy * (s * kx + c)
+    out[1, 2] = ty
+    out[2, 0] = 0.0
+    out[2, 1] = 0.0
+    out[2, 2] = 1.0
+
+
+def _rotate2D_into(angle_rad: float, out: np.ndarray) -> None:
+    """Writes the 2D rotation matrix into a preallocated 3x3 buffer."""
+    c, s = cos_sin(angle_rad)
+    out[0, 0] = c
+    out[0, 1] = -s
+    out[0, 2] = 0.0
+    out[1, 0] = s
+    out[1, 1] = c
+    out[1, 2] = 0.0
+    out[2, 0] = 0.0
+    out[2, 1] = 0.0
+    out[2, 2] = 1.0
+
+
+def _transform_2d_into(m: np.ndarray, coords: np.ndarray, weight: float, out: np.ndarray) -> None:
+    """Applies a 3x3 homogeneous matrix to the 2xN coordinates (x, y, weight), column by column.
+
+    Columns are independent: the parallel compiled version splits them across threads.
+    out may alias coords.
+    """
+    for j in prange(coords.shape[1]):
+        x = coords[0, j]
+        y = coords[1, j]
+        xt = m[0, 0] * x + m[0, 1] * y + m[0, 2] * weight
+        yt = m[1, 0] * x + m[1, 1] * y + m[1, 2] * weight
+        w = m[2, 0] * x + m[2, 1] * y + m[2, 2] * weight
+        if w != 0.0:
+            xt /= w
+            yt /= w
+        out[0, j] = xt
+        out[1, j] = yt
+
+
+def _transform_affine_2d_into(m: np.ndarray, coords: np.ndarray, weight: float, out: np.ndarray) -> None:
+    """Applies a 3x3 affine matrix to the 2xN coordinates (x, y, weight), column by column.
+
+    The bottom row of m is ignored: it must be [0, 0, 1], so the weight is unchanged
+    and no division is needed. Columns are independent: the parallel compiled version
+    splits them across threads. out may alias coords.
+    """
+    m00 = m[0, 0]
+    m01 = m[0, 1]
+    m10 = m[1, 0]
+    m11 = m[1, 1]
+    tx = m[0, 2] * weight
+    ty = m[1, 2] * weight
+    for j in prange(coords.shape[1]):
+        x = coords[0, j]
+        y = coords[1, j]
+        out[0, j] = m00 * x + m01 * y + tx
+        out[1, j] = m10 * x + m11 * y + ty
+
+
+def _compose_3x3_into(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    """Writes the 3x3 product a @ b into out, which must not alias a or b."""
+    for i in range(3):
+        for j in range(3):
+            out[i, j] = a[i, 0] * b[0, j] + a[i, 1] * b[1, j] + a[i, 2] * b[2, j]
+
+
+def _compose_affine_chain_2d_into(base: np.ndarray, transforms: np.ndarray, out: np.ndarray) -> int:
+    """Writes the running products base @ transforms[0] @ ... @ transforms[i] into out[i].
+
+    All matrices must be 3x3 affine: the running product is kept as its 2x2 linear
+    block and translation, so each step costs 12 multiplications instead of 27
+    and the [0, 0, 1] bottom row is only written to out.
+
+    Returns:
+        0 on success, 1 if a matrix is not affine. out is left untouched unless 0 is returned.
+    """
+    if base[2, 0] != 0.0 or base[2, 1] != 0.0 or base[2, 2] != 1.0:
+        return 1
+    for k in range(transforms.shape[0]):
+        if transforms[k, 2, 0] != 0.0 or transforms[k, 2, 1] != 0.0 or transforms[k, 2, 2] != 1.0:
+            return 1
+    a = base[0, 0]
+    b = base[0, 1]
+    tx = base[0, 2]
+    c = base[1, 0]
+    d = base[1, 1]
+    ty = base[1, 2]
+    for k in range(transforms.shape[0]):
+        m00 = transforms[k, 0, 0]
+        m01 = transforms[k, 0, 1]
+        m02 = transforms[k, 0, 2]
+        m10 = transforms[k, 1, 0]
+        m11 = transforms[k, 1, 1]
+        m12 = transforms[k, 1, 2]
+        tx = a * m02 + b * m12 + tx
+        ty = c * m02 + d * m12 + ty
+        a, b = a * m00 + b * m10, a * m01 + b * m11
+        c, d = c * m00 + d * m10, c * m01 + d * m11
+        out[k, 0, 0] = a
+        out[k, 0, 1] = b
+        out[k, 0, 2] = tx
+        out[k, 1, 0] = c
+        out[k, 1, 1] = d
+        out[k, 1, 2] = ty
+        out[k, 2, 0] = 0.0
+        out[k, 2, 1] = 0.0
+        out[k, 2, 2] = 1.0
+    return 0
+
+
+def _invert_affine_2d_into(m: np.ndarray, out: np.ndarray) -> int:
+    """Writes the closed-form inverse of a 3x3 affine matrix into out.
+
+    Returns:
+        0 on success, 1 if m is not affine (bottom row is not [0, 0, 1]),
+        2 if its linear part is singular. out is left untouched unless 0 is returned.
+    """
+    if m[2, 0] != 0.0 or m[2, 1] != 0.0 or m[2, 2] != 1.0:
+        return 1
+    det = m[0, 0] * m[1, 1] - m[0, 1] * m[1, 0]
+    if det == 0.0:
+        return 2
+    inv_det = 1.0 / det
+    a = m[1, 1] * inv_det
+    b = -m[0, 1] * inv_det
+    c = -m[1, 0] * inv_det
+    d = m[0, 0] * inv_det
+    tx = m[0, 2]
+    ty = m[1, 2]
+    out[0, 0] = a
+    out[0, 1] = b
+    out[0, 2] = -(a * tx + b * ty)
+    out[1, 0] = c
+    out[1, 1] = d
+    out[1, 2] = -(c * tx + d * ty)
+    out[2, 0] = 0.0
+    out[2, 1] = 0.0
+    out[2, 2] = 1.0
+    return 0
+
+
+def _relative_affine_2d_into(target: np.ndarray, source: np.ndarray, out: np.ndarray) -> int:
+    """Writes inv(target) @ source into out, without materializing the inverse.
+
+    Returns:
+        Same status codes as `_invert_affine_2d_into`, which describe target.
+        out is left untouched unless 0 is returned.
+    """
+    if target[2, 0] != 0.0 or target[2, 1] != 0.0 or target[2, 2] != 1.0:
+        return 1
+    det = target[0, 0] * target[1, 1] - target[0, 1] * target[1, 0]
+    if det == 0.0:
+        return 2
+    inv_det = 1.0 / det
+    a = target[1, 1] * inv_det
+    b = -target[0, 1] * inv_det
+    c = -target[1, 0] * inv_det
+    d = target[0, 0] * inv_det
+    tx = -(a * target[0, 2] + b * target[1, 2])
+    ty = -(c * target[0, 2] + d * target[1, 2])
+    for j in range(3):
+        s0 = source[0, j]
+        s1 = source[1, j]
+        s2 = source[2, j]
+        out[0, j] = a * s0 + b * s1 + tx * s2
+        out[1, j] = c * s0 + d * s1 + ty * s2
+        out[2, j] = s2
+    return 0
+
+
+if _HAS_NUMBA:
+    # Input matrices are typed read-only so that writeable and read-only arrays share one signature
+    _MAT = types.Array(types.float64, 2, 'A')
+    _MAT_RO = types.Array(types.float64, 2, 'A', readonly=True)
+    _MATS = types.Array(types.float64, 3, 'A')
+    _MATS_RO = types.Array(types.float64, 3, 'A', readonly=True)
+    _XY = types.UniTuple(types.float64, 2)
+    _F = types.float64
+    # Only allow FMA contraction: NaN/inf inputs must propagate like in numpy
+    _FASTMATH = {'contract'}
+
+    # Compiled first: the kernels below call it
+    cos_sin = njit([_XY(_F)], cache=True, fastmath=_FASTMATH)(_cos_sin)
+
+    apply_point_2d = njit([_XY(_MAT_RO, _F, _F)],
+                          cache=True, fastmath=_FASTMATH)(_apply_point_2d)
+    apply_vector_2d = njit([_XY(_MAT_RO, _F, _F)],
+                           cache=True, fastmath=_FASTMATH)(_apply_vector_2d)
+    trs2D_into = njit([types.void(_F, _F, _F, _F, _F, _MAT)],
+                      cache=True, fastmath=_FASTMATH)(_trs2D_into)
+    trks2D_into = njit([types.void(_F, _F, _F, _F, _F, _F, _F, _MAT)],
+                       cache=True, fastmath=_FASTMATH)(_trks2D_into)
+    rotate2D_into = njit([types.void(_F, _MAT)],
+                         cache=True, fastmath=_FASTMATH)(_rotate2D_into)
+    # Batch kernels are compiled twice: threads only pay off on large batches
+    _BATCH_SIGNATURE = [types.void(_MAT_RO, _MAT_RO, _F, _MAT)]
+    transform_2d_into = njit(_BATCH_SIGNATURE, cache=True, fastmath=_FASTMATH)(_transform_2d_into)
+    transform_2d_into_parallel = njit(_BATCH_SIGNATURE, cache=True, fastmath=_FASTMATH,
+                                      parallel=True)(_transform_2d_into)
+    transform_affine_2d_into = njit(_BATCH_SIGNATURE, cache=True, fastmath=_FASTMATH)(_transform_affine_2d_into)
+    transform_affine_2d_into_parallel = njit(_BATCH_SIGNATURE, cache=True, fastmath=_FASTMATH,
+                                             parallel=True)(_transform_affine_2d_into)
+    compose_3x3_into = njit([types.void(_MAT_RO, _MAT_RO, _MAT)],
+                            cache=True, fastmath=_FASTMATH)(_compose_3x3_into)
+    compose_affine_chain_2d_into = njit([types.int64(_MAT_RO, _MATS_RO, _MATS)],
+                                        cache=True, fastmath=_FASTMATH)(_compose_affine_chain_2d_into)
+    invert_affine_2d_into = njit([types.int64(_MAT_RO, _MAT)],
+                                 cache=True, fastmath=_FASTMATH)(_invert_affine_2d_into)
+    relative_affine_2d_into = njit([types.int64(_MAT_RO, _MAT_RO, _MAT)],
+                                   cache=True, fastmath=_FASTMATH)(_relative_affine_2d_into)
+else:  # pragma: no cover
+    cos_sin = _cos_sin
+    apply_point_2d = _apply_point_2d
+    apply_vector_2d = _apply_vector_2d
+    trs2D_into = _trs2D_into
+    trks2D_into = _trks2D_into
+    rotate2D_into = _rotate2D_into
+    transform_2d_into = transform_2d_into_parallel = _transform_2d_into
+    transform_affine_2d_into = transform_affine_2d_into_parallel = _transform_affine_2d_into
+    compose_3x3_into = _compose_3x3_into
+    compose_affine_chain_2d_into = _compose_affine_chain_2d_into
+    invert_affine_2d_into = _invert_affine_2d_into
+    relative_affine_2d_into = _relative_affine_2d_into
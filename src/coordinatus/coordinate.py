@@ -1,31 +1,49 @@
 """Coordinate representation classes for points and vectors."""
 
-from typing import Optional
+from typing import Optional, Sequence
 import numpy as np
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, DTypeLike
 
-from .frame import Frame
+from .frame import ABSOLUTE_FRAME, Frame
 from .types import CoordinateKind
+from .transforms.affine2d import Affine2D
+from ._transforms_numba import (
+    _HAS_NUMBA,
+    apply_point_2d,
+    apply_vector_2d,
+    get_num_threads,
+    transform_2d_into,
+    transform_2d_into_parallel,
+    transform_affine_2d_into,
+    transform_affine_2d_into_parallel,
+)
+from .precision import get_precision
 
 
-def transform_coordinate(transform: np.ndarray, coordinates: np.ndarray, kind: CoordinateKind) -> np.ndarray:
+def transform_coordinate(transform: np.ndarray, coordinates: np.ndarray, kind: CoordinateKind,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
     """Applies an affine transformation to a coordinate, respecting point vs vector semantics.
     
     Points and vectors transform differently under affine transformations:
     - Points (weight=1): Affected by translation, rotation, and scaling
     - Vectors (weight=0): Affected only by rotation and scaling, NOT translation
     
-    This function converts to homogeneous coordinates, applies the transformation,
-    and converts back to Cartesian coordinates.
+    Dispatches to `transform_point` or `transform_vector`, which can be called directly
+    when the kind is known in advance. For affine transforms, the linear part and the
+    translation are applied directly. Otherwise, the coordinates are converted to
+    homogeneous coordinates, transformed, and converted back to Cartesian coordinates.
     
     Args:
         transform: 3x3 affine transformation matrix in homogeneous coordinates.
         coordinates: 2D coordinate as numpy array [x, y] or DxN array where D is dimensions
                     and N is the number of points/vectors.
         kind: CoordinateKind.POINT or CoordinateKind.VECTOR.
+        out: Optional preallocated array to write the result into. It must have the
+            shape of the result. Reusing it across calls avoids an allocation per batch.
     
     Returns:
         Transformed 2D coordinate as numpy array [x', y'] or DxN array of transformed coordinates.
+        This is `out` if it was given.
     
     Examples:
         >>> # Single point translation
@@ -40,6 +58,167 @@ def transform_coordinate(transform: np.ndarray, coordinates: np.ndarray, kind: C
         >>> transform_coordinate(translate2D(5, 3), np.array([[1, 2], [2, 4]]), CoordinateKind.POINT)
         array([[6., 7.], [5., 7.]])  # All points moved by (5, 3)
     """
+    if kind == CoordinateKind.POINT:
+        return transform_point(transform, coordinates, out)
+    return transform_vector(transform, coordinates, out)
+
+
+def transform_point(transform: np.ndarray, coordinates: np.ndarray,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Applies a transformation to points (weight=1): translation is applied.
+    
+    Args:
+        transform: Transformation matrix in homogeneous coordinates.
+        coordinates: Single point [x, y, ...] or DxN array of N points.
+        out: Optional preallocated array to write the result into.
+    
+    Returns:
+        Transformed points, with the same layout as `coordinates`. This is `out` if it was given.
+    
+    Examples:
+        >>> transform_point(translate2D(5, 3), np.array([1, 2]))
+        array([6., 5.])
+    """
+    # Fast path: a single 2D point under a 3x3 transform is computed with
+    # plain scalar arithmetic, avoiding the homogeneous array round-trip entirely
+    if coordinates.shape == (2,) and transform.shape == (3, 3):
+        if _HAS_NUMBA and transform.dtype == np.float64:
+            x, y = coordinates.tolist()
+            return _store(np.array(apply_point_2d(transform, float(x), float(y))), out)
+        affine = Affine2D.try_from_matrix(transform)
+        if affine is not None:
+            x, y = coordinates.tolist()
+            return _store(np.array(affine.apply_point(x, y), dtype=_result_dtype(transform, coordinates)), out)
+
+    if _HAS_NUMBA:
+        result = _transform_2d_batch(transform, coordinates, 1.0, out)
+        if result is not None:
+            return result
+
+    if _is_affine(transform):
+        result = _apply_linear(transform, coordinates, out)
+        translation = transform[:-1, -1]
+        result += translation if coordinates.ndim == 1 else translation[:, np.newaxis]
+        return result
+
+    return _store(_transform_homogeneous(transform, coordinates, 1.0), out)
+
+
+def transform_vector(transform: np.ndarray, coordinates: np.ndarray,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Applies a transformation to vectors (weight=0): translation is ignored.
+    
+    Args:
+        transform: Transformation matrix in homogeneous coordinates.
+        coordinates: Single vector [x, y, ...] or DxN array of N vectors.
+        out: Optional preallocated array to write the result into.
+    
+    Returns:
+        Transformed vectors, with the same layout as `coordinates`. This is `out` if it was given.
+    
+    Examples:
+        >>> transform_vector(translate2D(5, 3), np.array([1, 2]))
+        array([1., 2.])
+    """
+    # Fast path: see transform_point
+    if coordinates.shape == (2,) and transform.shape == (3, 3):
+        if _HAS_NUMBA and transform.dtype == np.float64:
+            x, y = coordinates.tolist()
+            return _store(np.array(apply_vector_2d(transform, float(x), float(y))), out)
+        affine = Affine2D.try_from_matrix(transform)
+        if affine is not None:
+            x, y = coordinates.tolist()
+            return _store(np.array(affine.apply_vector(x, y), dtype=_result_dtype(transform, coordinates)), out)
+
+    if _HAS_NUMBA:
+        result = _transform_2d_batch(transform, coordinates, 0.0, out)
+        if result is not None:
+            return result
+
+    if _is_affine(transform):
+        return _apply_linear(transform, coordinates, out)
+
+    return _store(_transform_homogeneous(transform, coordinates, 0.0), out)
+
+
+# Lets coordinates pick their specialized transform with one lookup instead of branching
+_TRANSFORM_BY_KIND = {
+    CoordinateKind.POINT: transform_point,
+    CoordinateKind.VECTOR: transform_vector,
+}
+
+
+# Below this many coordinates, starting threads costs more than it saves
+_PARALLEL_MIN_N = 100_000
+
+
+def _transform_2d_batch(transform: np.ndarray, coordinates: np.ndarray, weight: float,
+                        out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """Transforms a 2xN float64 batch with a compiled kernel.
+    
+    Affine transforms use a kernel that skips the weight row and the division.
+    Both kernels loop over the columns in a single pass, without the temporaries
+    of numpy's matmul and broadcasting, and split large batches across threads.
+    
+    Returns:
+        The transformed coordinates, or None if the kernel does not apply.
+    """
+    if transform.shape != (3, 3) or coordinates.ndim != 2 or coordinates.shape[0] != 2 \
+            or transform.dtype != np.float64 or coordinates.dtype != np.float64:
+        return None
+    if out is not None and (out.dtype != np.float64 or out.shape != coordinates.shape):
+        return None
+    if out is None:
+        out = np.empty(coordinates.shape)
+    if coordinates.shape[1] >= _PARALLEL_MIN_N and get_num_threads() > 1:
+        kernel = transform_affine_2d_into_parallel if _is_affine(transform) else transform_2d_into_parallel
+    else:
+        kernel = transform_affine_2d_into if _is_affine(transform) else transform_2d_into
+    kernel(transform, coordinates, weight, out)
+    return out
+
+
+def _result_dtype(transform: np.ndarray, coordinates: np.ndarray) -> np.dtype:
+    """Returns the dtype of transformed coordinates: at least the working precision.
+    
+    With float32 precision, float32 transforms and coordinates stay float32 instead of
+    being upcast. Integer inputs always produce floats.
+    """
+    return np.result_type(transform.dtype, coordinates.dtype, get_precision())
+
+
+def _is_affine(transform: np.ndarray) -> bool:
+    """Checks whether the bottom row of a homogeneous transform is [0, ..., 0, 1]."""
+    return transform[-1, -1] == 1 and not transform[-1, :-1].any()
+
+
+def _apply_linear(transform: np.ndarray, coordinates: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """Applies the linear block of an affine transform to one or N coordinates.
+    
+    Affine transforms leave the homogeneous weight unchanged, so the coordinates
+    are transformed without building homogeneous coordinates nor normalizing by the weight.
+    """
+    if out is not None:
+        dtype = out.dtype
+    else:
+        dtype = _result_dtype(transform, coordinates)
+    return np.matmul(transform[:-1, :-1], coordinates, dtype=dtype, out=out)
+
+
+def _transform_homogeneous(transform: np.ndarray, coordinates: np.ndarray, weight: float) -> np.ndarray:
+    """Applies a general (projective) transform through homogeneous coordinates."""
+    # A single 2D coordinate is computed inline, without any intermediate array
+    if coordinates.shape == (2,) and transform.shape == (3, 3):
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = transform.tolist()
+        x, y = coordinates.tolist()
+        xt = m00 * x + m01 * y + m02 * weight
+        yt = m10 * x + m11 * y + m12 * weight
+        w = m20 * x + m21 * y + m22 * weight
+        if w != 0:
+            xt /= w
+            yt /= w
+        return np.array([xt, yt], dtype=_result_dtype(transform, coordinates))
+
     # Check if we have a single coordinate (1D) - if so, reshape to (D, 1)
     is_single = coordinates.ndim == 1
     if is_single:
@@ -48,24 +227,20 @@ def transform_coordinate(transform: np.ndarray, coordinates: np.ndarray, kind: C
     # Handle DxN array where D is dimensions and N is number of points
     D, N = coordinates.shape
     
-    # Convert to homogeneous coordinates by adding a row of weights
-    weight = 1.0 if kind == CoordinateKind.POINT else 0.0
-    weights = np.full((1, N), weight)
-    homogeneous_coords = np.vstack([coordinates, weights])  # Shape (D+1, N)
+    # Convert to homogeneous coordinates by writing the weights below the coordinates
+    homogeneous_coords = np.empty((D + 1, N), dtype=_result_dtype(transform, coordinates))
+    homogeneous_coords[:D] = coordinates
+    homogeneous_coords[D] = weight  # Shape (D+1, N)
     
     # Apply transformation: (3, 3) @ (3, N) -> (3, N)
-    transformed_coords = transform @ homogeneous_coords
+    transformed_coords = np.matmul(transform, homogeneous_coords)
     
-    # Return to Cartesian coordinates
-    # Normalize by the weight (last row) if necessary
-    weights = transformed_coords[-1, :]
-    # Avoid division by zero - only normalize where weight != 0
-    non_zero_mask = weights != 0
-    if np.any(non_zero_mask):
-        transformed_coords[:, non_zero_mask] /= weights[non_zero_mask]
-    
-    # Return all dimensions except the last (weight) row
-    result = transformed_coords[:D, :]
+    # Return to Cartesian coordinates: all dimensions except the last (weight) row
+    result = transformed_coords[:-1]
+    weights = transformed_coords[-1]
+    # Normalize by the weight in place, without gathering and scattering the non-zero
+    # columns; zero weights are skipped to avoid division by zero
+    np.divide(result, weights, out=result, where=weights != 0)
     
     # If input was 1D, return 1D
     if is_single:
@@ -74,6 +249,14 @@ def transform_coordinate(transform: np.ndarray, coordinates: np.ndarray, kind: C
     return result
 
 
+def _store(result: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """Copies result into out if it is given, and returns the array holding the result."""
+    if out is None:
+        return result
+    out[...] = result
+    return out
+
+
 class Coordinate:
     """Base class for representing coordinates (points or vectors) in a coordinate frame.
     
@@ -104,11 +287,11 @@ class Coordinate:
                          Can be [x, y] for a single point/vector or [[x1, x2, ...], [y1, y2, ...]]
                          for multiple points/vectors.
             frame: Coordinate frame this coordinate is defined in.
-                   If None, uses absolute/identity frame.
+                   If None, uses the shared absolute/identity frame ABSOLUTE_FRAME.
         """
         self.kind = kind
         self.coords = np.asarray(coords)
-        self.frame = frame if frame is not None else Frame()
+        self.frame = frame if frame is not None else ABSOLUTE_FRAME
 
     @property
     def D(self) -> int:
@@ -138,6 +321,88 @@ class Coordinate:
             return 1
         return self.coords.shape[1]
 
+    @staticmethod
+    def stack(coordinates: Sequence['Coordinate'], frame: Optional[Frame] = None,
+              dtype: Optional[DTypeLike] = None) -> 'Coordinate':
+        """Stacks coordinates of the same kind into a single DxN coordinate.
+
+        Converting the stacked coordinate to another frame computes the conversion
+        matrix once and applies it to all N columns in one matrix product, instead of
+        once per coordinate.
+
+        When a target frame is given, the coordinates may come from different frames:
+        they are grouped by source frame, and each group is converted to the target
+        frame with a single conversion matrix and matrix product.
+
+        Args:
+            coordinates: Non-empty sequence of coordinates, each a single coordinate
+                        or a DxN batch. All must have the same kind.
+            frame: Optional frame to express the stacked coordinate in. If None, all
+                  coordinates must share a frame, which the result keeps.
+            dtype: Optional dtype of the result. The coordinates and conversion matrices
+                  are cast to it, so that the conversion itself runs in this dtype.
+                  If None, the dtype follows the inputs and the global precision.
+
+        Returns:
+            A coordinate of the same type as the first one, whose columns are the
+            input coordinates in order.
+
+        Raises:
+            ValueError: If the sequence is empty, the kinds differ, or no frame
+                       is given and the frames differ.
+
+        Examples:
+            >>> points = [Point([0, 0], frame), Point([1, 0], frame), Point([0, 1], frame)]
+            >>> batch = Coordinate.stack(points)
+            >>> batch.N  # 3
+            >>> batch.to_absolute()  # one matrix product for all three points
+            >>> Coordinate.stack([Point([0, 0], frame_a), Point([0, 0], frame_b)], frame=target)
+        """
+        if len(coordinates) == 0:
+            raise ValueError("Cannot stack an empty sequence of coordinates.")
+        first = coordinates[0]
+        for coordinate in coordinates[1:]:
+            if frame is None and coordinate.frame != first.frame:
+                raise ValueError("Cannot stack coordinates from different frames. Convert to same frame first.")
+            if coordinate.kind != first.kind:
+                raise ValueError("Cannot stack points and vectors together.")
+        if frame is None:
+            stacked = np.column_stack([coordinate.coords for coordinate in coordinates])
+            return first._make_new(stacked if dtype is None else stacked.astype(dtype, copy=False))
+
+        # Group coordinates by source frame, so that each distinct conversion is computed once
+        groups: dict[int, list[int]] = {}
+        for i, coordinate in enumerate(coordinates):
+            groups.setdefault(id(coordinate.frame), []).append(i)
+
+        # A lone coordinate is reshaped to DxN without copying, larger groups are stacked
+        group_coords = [np.column_stack([coordinates[i].coords for i in indices]) if len(indices) > 1
+                        else coordinates[indices[0]].coords.reshape(coordinates[indices[0]].D, -1)
+                        for indices in groups.values()]
+        relative_transforms = [coordinates[indices[0]].frame._cached_relative_transform_to(frame)
+                               for indices in groups.values()]
+        if dtype is None:
+            dtype = np.result_type(*[_result_dtype(relative_transform, coords)
+                                     for relative_transform, coords in zip(relative_transforms, group_coords)])
+        else:
+            group_coords = [coords.astype(dtype, copy=False) for coords in group_coords]
+            relative_transforms = [relative_transform.astype(dtype, copy=False)
+                                   for relative_transform in relative_transforms]
+
+        # Sized from the conversion matrices, whose output dimension may differ from the input one
+        starts = np.cumsum([0] + [coordinate.N for coordinate in coordinates])
+        result = np.empty((relative_transforms[0].shape[0] - 1, starts[-1]), dtype=dtype)
+        transform = _TRANSFORM_BY_KIND[first.kind]
+        if len(groups) == 1:
+            transform(relative_transforms[0], group_coords[0], out=result)
+            return first._make_new(result, frame=frame)
+
+        for indices, relative_transform, coords in zip(groups.values(), relative_transforms, group_coords):
+            columns = np.concatenate([np.arange(starts[i], starts[i + 1]) for i in indices])
+            group_result = np.empty((result.shape[0], coords.shape[1]), dtype=dtype)
+            result[:, columns] = transform(relative_transform, coords, out=group_result)
+        return first._make_new(result, frame=frame)
+
     def _make_new(self, coords: np.ndarray, frame: Optional[Frame] = None) -> 'Coordinate':
         """Create a new coordinate of the same type as self.
         
@@ -147,7 +412,7 @@ class Coordinate:
         Args:
             coords: The coordinate values.
             frame: The coordinate frame. If not provided, uses self.frame.
-                  Pass Frame() explicitly for identity frame.
+                  Pass ABSOLUTE_FRAME explicitly for identity frame.
         
         Returns:
             A new instance of the same type as self with the given coords and frame.
@@ -281,8 +546,8 @@ class Coordinate:
             >>> absolute_point.coords  # Should be [14, 8]
         """
         absolute_transform = self.frame.compute_absolute_transform()
-        absolute_coords = transform_coordinate(absolute_transform, self.coords, self.kind)
-        return self._make_new(absolute_coords, frame=Frame())
+        absolute_coords = _TRANSFORM_BY_KIND[self.kind](absolute_transform, self.coords)
+        return self._make_new(absolute_coords, frame=ABSOLUTE_FRAME)
         
     def relative_to(self, target_frame: Frame) -> 'Coordinate':
         """Converts this coordinate to a different coordinate frame.
@@ -303,9 +568,9 @@ class Coordinate:
             >>> point_in_b = point_in_a.relative_to(frame_b)
             >>> point_in_b.coords  # Should be [5, -3]
         """
-        # Inverse transform from absolute to target frame
-        relative_transform = self.frame.compute_relative_transform_to(target_frame)
-        relative_coords = transform_coordinate(relative_transform, self.coords, self.kind)
+        # Inverse transform from absolute to target frame, composed once for all N coordinates
+        relative_transform = self.frame._cached_relative_transform_to(target_frame)
+        relative_coords = _TRANSFORM_BY_KIND[self.kind](relative_transform, self.coords)
         return self._make_new(relative_coords, frame=target_frame)
 
 
@@ -1,9 +1,32 @@
 """Coordinate frame representation and operations."""
 
+from collections import OrderedDict
 from typing import Optional
+import itertools
+import weakref
 import numpy as np
 
 from .transforms import trs2D
+from .transforms.affine2d import Affine2D
+from ._transforms_numba import (
+    _HAS_NUMBA,
+    compose_3x3_into,
+    compose_affine_chain_2d_into,
+    invert_affine_2d_into,
+    relative_affine_2d_into,
+)
+from .precision import _IDENTITY_3_BY_DTYPE, _identity_3, get_precision
+
+_IDENTITY_3 = _IDENTITY_3_BY_DTYPE[np.dtype(np.float64)]
+
+# Unique across all frames, so a frame reusing the id of a collected frame never hits its cache entries
+_revisions = itertools.count()
+
+# Bounded FIFO cache of relative transforms used by coordinate conversions,
+# keyed on (id(source), id(target), source revision, target revision)
+_RELATIVE_CACHE_SIZE = 256
+_relative_cache: 'OrderedDict[tuple[int, int, int, int], np.ndarray]' = OrderedDict()
+
 
 class Frame:
     """A coordinate frame that can be nested within other frames.
@@ -15,9 +38,13 @@ class Frame:
     
     Attributes:
         transform: 3x3 affine transformation matrix from this frame to its parent.
-                  Defaults to identity if not specified.
+                  Defaults to identity if not specified. Assign a new matrix to change
+                  it: in-place modifications are not seen by cached absolute transforms.
         parent: Optional parent coordinate frame. If None, this is a root/absolute frame.
     
+    The shared `ABSOLUTE_FRAME` instance is the default frame of coordinates and
+    cannot be modified.
+    
     Examples:
         >>> # Create a root coordinate frame
         >>> root = Frame()
@@ -28,17 +55,110 @@ class Frame:
         >>> # Get transformation to absolute space
         >>> absolute_t = child.compute_absolute_transform()
     """
+    # Only set on ABSOLUTE_FRAME, which is shared by all coordinates created without a frame
+    _frozen = False
+
     def __init__(self, transform: Optional[np.ndarray] = None, parent: Optional['Frame'] = None):
         """Initialize a coordinate frame.
         
         Args:
             transform: 3x3 affine transformation matrix relative to parent.
-                      If None, uses identity (no transformation).
+                      If None, uses a shared read-only identity (no transformation).
             parent: Parent coordinate frame. If None, this is a root frame.
         """
-        self.transform = transform if transform is not None else np.eye(3)
+        # None when stale: invalidated by this frame and its ancestors when they change
+        self._absolute_cache: Optional[np.ndarray] = None
+        # Renewed whenever the transforms this frame converts with may have changed
+        self._revision = next(_revisions)
+        # Weak references to the child frames, created on first child. Frames define __eq__
+        # and are therefore unhashable: children are keyed by id
+        self._children: Optional[dict[int, weakref.ref]] = None
+        self._parent: Optional[Frame] = None
+        self.transform = transform if transform is not None else _identity_3()
         self.parent = parent
 
+    @property
+    def transform(self) -> np.ndarray:
+        """3x3 affine transformation matrix from this frame to its parent."""
+        return self._transform
+
+    @transform.setter
+    def transform(self, value: np.ndarray) -> None:
+        if self._frozen:
+            raise AttributeError("The absolute frame cannot be modified.")
+        self._transform = value
+        self._invalidate_absolute_cache()
+
+    @property
+    def parent(self) -> Optional['Frame']:
+        """Parent coordinate frame, or None for a root/absolute frame."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Optional['Frame']) -> None:
+        if self._frozen:
+            raise AttributeError("The absolute frame cannot be modified.")
+        ancestor = value
+        while ancestor is not None:
+            if ancestor is self:
+                raise ValueError("A frame cannot be its own ancestor.")
+            ancestor = ancestor.parent
+        if self._parent is not None and self._parent._children is not None:
+            self._parent._children.pop(id(self), None)
+        if value is not None:
+            value._register_child(self)
+        self._parent = value
+        self._invalidate_absolute_cache()
+
+    def _register_child(self, child: 'Frame') -> None:
+        """Adds a weak reference to child, so that changes to this frame invalidate its caches."""
+        if self._children is None:
+            self._children = {}
+        children = self._children
+        key = id(child)
+        children[key] = weakref.ref(child, lambda _, children=children, key=key: children.pop(key, None))
+
+    def __getstate__(self) -> dict:
+        """Returns the state to copy or pickle, without the caches nor the child registry.
+
+        Weak references cannot be copied nor pickled, and a copy must not be invalidated
+        by the children of the original: the registry is rebuilt by the restored children.
+        """
+        state = self.__dict__.copy()
+        del state['_children'], state['_absolute_cache'], state['_revision']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores a copied or unpickled frame with empty caches and registers it with its parent."""
+        self.__dict__.update(state)
+        self._absolute_cache = None
+        self._revision = next(_revisions)
+        self._children = None
+        if self._parent is not None:
+            self._parent._register_child(self)
+
+    def __reduce_ex__(self, protocol):
+        # The absolute frame is a singleton: copies and unpickled coordinates keep referring to it
+        if self is ABSOLUTE_FRAME:
+            return 'ABSOLUTE_FRAME'
+        return super().__reduce_ex__(protocol)
+
+    def _invalidate_absolute_cache(self) -> None:
+        """Marks the absolute transforms of this frame and all its descendants as stale."""
+        self._absolute_cache = None
+        self._revision = next(_revisions)
+        # Caches are filled top-down, so the descendants of a stale frame are already stale
+        stack = [self]
+        while stack:
+            frame = stack.pop()
+            if frame._children is not None:
+                for ref in frame._children.values():
+                    child = ref()
+                    if child is not None and child._absolute_cache is not None:
+                        child._absolute_cache = None
+                        child._revision = next(_revisions)
+                        stack.append(child)
+
     @property
     def D_in(self) -> int:
         """
@@ -110,7 +230,7 @@ class Frame:
         
         # Both are identity frames (no parent and identity transform)
         if self.parent is None and other.parent is None:
-            return np.allclose(self.transform, np.eye(3)) and np.allclose(other.transform, np.eye(3))
+            return np.allclose(self.transform, _IDENTITY_3) and np.allclose(other.transform, _IDENTITY_3)
         
         return False
 
@@ -121,10 +241,15 @@ class Frame:
     def compute_absolute_transform(self) -> np.ndarray:
         """Computes the cumulative transformation matrix from this frame to absolute space.
         
-        Recursively multiplies transformation matrices up the hierarchy to compute
+        Multiplies transformation matrices down the hierarchy to compute
         the complete transformation from this coordinate frame to the root (absolute)
         coordinate frame.
         
+        The result is memoized: reassigning the transform or parent of a frame marks
+        the cached absolute transforms of the frame and its descendants as stale, so
+        a cached result is returned without walking the hierarchy. The returned
+        array is read-only since it is shared between calls.
+        
         Returns:
             3x3 numpy array representing the transformation from frame-relative to absolute coordinates.
         
@@ -134,10 +259,32 @@ class Frame:
             >>> absolute_t = child.compute_absolute_transform()
             >>> # absolute_t represents translation by (13, 7)
         """
-        if self.parent is None:
-            return self.transform
-        else:
-            return self.parent.compute_absolute_transform() @ self.transform
+        if self._absolute_cache is not None:
+            return self._absolute_cache
+        if self._parent is None:
+            return self._transform
+
+        # Walk up to the closest up-to-date ancestor, then refresh stale caches from the top down
+        chain = []
+        frame = self
+        while frame._parent is not None and frame._absolute_cache is None:
+            chain.append(frame)
+            frame = frame._parent
+
+        absolute = frame._absolute_cache if frame._absolute_cache is not None else frame._transform
+        chain.reverse()
+        if _HAS_NUMBA and len(chain) > 1:
+            absolutes = _compose_affine_chain(absolute, [frame._transform for frame in chain])
+            if absolutes is not None:
+                for frame, frame_absolute in zip(chain, absolutes):
+                    frame._absolute_cache = frame_absolute
+                return frame_absolute
+
+        for frame in chain:
+            absolute = _compose(absolute, frame._transform)
+            absolute.setflags(write=False)
+            frame._absolute_cache = absolute
+        return absolute
 
     def compute_relative_transform_to(self, target_frame: 'Frame') -> np.ndarray:
         """Computes the transformation matrix to convert coordinates from this frame to another.
@@ -147,6 +294,10 @@ class Frame:
         1. Transforming from this frame to absolute space
         2. Transforming from absolute space to the target frame
         
+        When the target is this frame's parent, its child, or its sibling, the
+        transforms above their common parent cancel out and only the local transforms
+        are used: they are neither multiplied nor inverted.
+        
         Args:
             target_frame: The destination coordinate frame.
         
@@ -160,8 +311,114 @@ class Frame:
             >>> convert_t = frame_a.compute_relative_transform_to(frame_b)
             >>> # Use convert_t to express frame_a coordinates in frame_b
         """
-        inv_transform = np.linalg.inv(target_frame.compute_absolute_transform())
-        return inv_transform @ self.compute_absolute_transform()
+        # When one frame is the parent of the other, or both share a parent, the transforms
+        # above that common ancestor cancel out: only the local transforms are needed
+        parent = self.parent
+        if target_frame is self:
+            return np.eye(self.transform.shape[1], dtype=get_precision())
+        if target_frame is parent:
+            return self.transform.copy()
+        if target_frame.parent is self:
+            return _invert(target_frame.transform)
+        if target_frame.parent is parent:
+            return _relative(target_frame.transform, self.transform)
+
+        # Otherwise go through absolute space, whose transforms are memoized
+        # Composing the two matrices first means a batch of N coordinates is then transformed
+        # with a single matmul: inv @ (absolute @ coords) would cost two passes over the points
+        return _relative(target_frame.compute_absolute_transform(), self.compute_absolute_transform())
+
+    def _cached_relative_transform_to(self, target_frame: 'Frame') -> np.ndarray:
+        """Returns compute_relative_transform_to(target_frame) from a cache shared by all frames.
+
+        Repeated conversions between the same two frames reuse the matrix until one of
+        them, or one of their ancestors, changes. The result is read-only since it is shared.
+        """
+        key = (id(self), id(target_frame), self._revision, target_frame._revision)
+        relative = _relative_cache.get(key)
+        if relative is None:
+            relative = self.compute_relative_transform_to(target_frame)
+            relative.setflags(write=False)
+            if len(_relative_cache) >= _RELATIVE_CACHE_SIZE:
+                _relative_cache.popitem(last=False)
+            _relative_cache[key] = relative
+        return relative
+
+
+def _compose(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Returns a @ b, using the compiled 3x3 kernel when numba is available."""
+    if _HAS_NUMBA and a.shape == (3, 3) and b.shape == (3, 3) \
+            and a.dtype == np.float64 and b.dtype == np.float64:
+        out = np.empty((3, 3))
+        compose_3x3_into(a, b, out)
+        return out
+    return a @ b
+
+
+def _compose_affine_chain(base: np.ndarray, transforms: list[np.ndarray]) -> Optional[np.ndarray]:
+    """Returns the running products base @ transforms[0] @ ... @ transforms[i], in one kernel call.
+
+    Returns:
+        A read-only (len(transforms), 3, 3) array, or None unless all matrices are
+        3x3 float64 affine transforms.
+    """
+    try:
+        stacked = np.array(transforms)
+    except ValueError:  # transforms of different shapes
+        return None
+    if base.shape != (3, 3) or base.dtype != np.float64 or stacked.shape[1:] != (3, 3) or stacked.dtype != np.float64:
+        return None
+    out = np.empty(stacked.shape)
+    if compose_affine_chain_2d_into(base, stacked, out) != 0:
+        return None
+    out.setflags(write=False)
+    return out
+
+
+def _invert(matrix: np.ndarray) -> np.ndarray:
+    """Returns the inverse of a transform, in closed form for 2D affine transforms.
+
+    Raises:
+        np.linalg.LinAlgError: If the matrix is singular.
+    """
+    if _HAS_NUMBA and matrix.shape == (3, 3) and matrix.dtype == np.float64:
+        out = np.empty((3, 3))
+        status = invert_affine_2d_into(matrix, out)
+        if status == 0:
+            return out
+        if status == 2:
+            raise np.linalg.LinAlgError("Singular matrix")
+        return np.linalg.inv(matrix)
+    # 2D affine transforms are inverted in closed form, avoiding LAPACK's generic path
+    affine = Affine2D.try_from_matrix(matrix)
+    if affine is not None:
+        # Affine2D works in float64: cast back so that float32 transforms stay float32
+        return affine.inverse().to_matrix().astype(np.result_type(matrix.dtype, np.float32), copy=False)
+    return np.linalg.inv(matrix)
+
+
+def _relative(target_absolute: np.ndarray, source_absolute: np.ndarray) -> np.ndarray:
+    """Returns inv(target_absolute) @ source_absolute.
+
+    With numba, 2D affine targets are inverted and composed in a single kernel,
+    so the inverse is never materialized as a temporary array.
+
+    Raises:
+        np.linalg.LinAlgError: If target_absolute is singular.
+    """
+    if _HAS_NUMBA and target_absolute.shape == (3, 3) and source_absolute.shape == (3, 3) \
+            and target_absolute.dtype == np.float64 and source_absolute.dtype == np.float64:
+        out = np.empty((3, 3))
+        status = relative_affine_2d_into(target_absolute, source_absolute, out)
+        if status == 0:
+            return out
+        if status == 2:
+            raise np.linalg.LinAlgError("Singular matrix")
+    return _compose(_invert(target_absolute), source_absolute)
+
+
+ABSOLUTE_FRAME = Frame()
+ABSOLUTE_FRAME._frozen = True
 
 
 def create_frame(parent: Optional[Frame]=None, tx: float=0.0, ty: float=0.0, angle_rad: float=0.0, sx: float=1.0, sy: float=1.0) -> Frame:
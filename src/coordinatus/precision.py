@@ -0,0 +1,52 @@
+"""Working floating point precision of the transformation builders."""
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+_SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+_dtype = np.dtype(np.float64)
+
+
+def _read_only_identity(dtype: np.dtype) -> np.ndarray:
+    identity = np.eye(3, dtype=dtype)
+    identity.setflags(write=False)
+    return identity
+
+
+# Shared 3x3 identities: read-only, so builders and frames can return them without copying
+_IDENTITY_3_BY_DTYPE = {dtype: _read_only_identity(dtype) for dtype in _SUPPORTED_DTYPES}
+
+
+def set_precision(dtype: DTypeLike) -> None:
+    """Sets the dtype of the matrices created by the transformation builders.
+
+    The default is float64. float32 halves the memory traffic of batched coordinate
+    transforms, at the cost of about 7 significant digits, which is usually enough for
+    screen-space graphics. Keep float64 for precision-critical work.
+
+    Args:
+        dtype: np.float32 or np.float64.
+
+    Raises:
+        ValueError: If dtype is not float32 or float64.
+
+    Examples:
+        >>> set_precision(np.float32)
+        >>> translate2D(1, 2).dtype
+        dtype('float32')
+    """
+    global _dtype
+    dtype = np.dtype(dtype)
+    if dtype not in _SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported precision {dtype}, expected float32 or float64.")
+    _dtype = dtype
+
+
+def get_precision() -> np.dtype:
+    """Returns the dtype of the matrices created by the transformation builders."""
+    return _dtype
+
+
+def _identity_3() -> np.ndarray:
+    """Returns the shared read-only 3x3 identity in the working precision."""
+    return _IDENTITY_3_BY_DTYPE[_dtype]
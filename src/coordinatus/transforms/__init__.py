@@ -1,10 +1,15 @@
 """Transformation matrix utilities for 2D affine transformations."""
 
 import numpy as np
+from numpy.typing import ArrayLike
+
+from .._transforms_numba import _HAS_NUMBA, cos_sin, trs2D_into, trks2D_into
+from ..precision import _identity_3, get_precision
 
 from .translate import translate, translate2D, translate3D
-from .rotate import rotate2D, rotate3Dx, rotate3Dy, rotate3Dz
+from .rotate import rotate2D, rotate2D_batch, rotate3Dx, rotate3Dy, rotate3Dz
 from .scale import scale, scale2D, scale3D, shear2D
+from .affine2d import Affine2D
 from .dimension import (
     swap_axes,
     reduce_dim,
@@ -21,21 +26,95 @@ from .dimension import (
 
 
 def trs2D(tx: float, ty: float, angle_rad: float, sx: float, sy: float) -> np.ndarray:
-    """Creates a combined translation, rotation, and scaling matrix."""
-    T = translate2D(tx, ty)
-    R = rotate2D(angle_rad)
-    S = scale2D(sx, sy)
-    return T @ R @ S
+    """Creates a combined translation, rotation, and scaling matrix.
+
+    A shared read-only identity is returned when the parameters describe no transformation.
+    """
+    if tx == 0 and ty == 0 and angle_rad == 0 and sx == 1 and sy == 1:
+        return _identity_3()
+    dtype = get_precision()
+    if _HAS_NUMBA and dtype == np.float64:
+        M = np.empty((3, 3))
+        trs2D_into(float(tx), float(ty), float(angle_rad), float(sx), float(sy), M)
+        return M
+    # Closed form of T @ R @ S: avoids building three matrices and two matmuls
+    c, s = cos_sin(angle_rad)
+    return np.array([[sx * c, -sy * s, tx],
+                     [sx * s,  sy * c, ty],
+                     [0,       0,      1]], dtype=dtype)
+
+
+def trs2D_batch(tx: ArrayLike, ty: ArrayLike, angle_rad: ArrayLike, sx: ArrayLike, sy: ArrayLike) -> np.ndarray:
+    """Creates one combined translation, rotation, and scaling matrix per set of parameters.
+    
+    The parameters are broadcast against each other, so scalars can be mixed with arrays.
+    
+    Returns:
+        An array of shape broadcast_shape + (3, 3) where [..., :, :] is trs2D of the
+        corresponding parameters.
+    
+    Examples:
+        >>> M = trs2D_batch(xs, ys, angles, 1, 1)  # one matrix per (x, y, angle)
+    """
+    tx, ty, angle_rad, sx, sy = np.broadcast_arrays(tx, ty, angle_rad, sx, sy)
+    c = np.cos(angle_rad)
+    s = np.sin(angle_rad)
+    M = np.zeros(angle_rad.shape + (3, 3), dtype=get_precision())
+    M[..., 0, 0] = sx * c
+    M[..., 0, 1] = -sy * s
+    M[..., 0, 2] = tx
+    M[..., 1, 0] = sx * s
+    M[..., 1, 1] = sy * c
+    M[..., 1, 2] = ty
+    M[..., 2, 2] = 1
+    return M
 
 
 def trks2D(tx: float, ty: float, angle_rad: float, kx: float, ky: float, sx: float, sy: float) -> np.ndarray:
-    """Creates a combined translation, rotation, shear, and scaling matrix."""
-    T = translate2D(tx, ty)
-    R = rotate2D(angle_rad)
-    K = shear2D(kx, ky)
-    S = scale2D(sx, sy)
-    return T @ R @ K @ S
+    """Creates a combined translation, rotation, shear, and scaling matrix.
+
+    A shared read-only identity is returned when the parameters describe no transformation.
+    """
+    if kx == 0 and ky == 0:
+        return trs2D(tx, ty, angle_rad, sx, sy)
+    dtype = get_precision()
+    if _HAS_NUMBA and dtype == np.float64:
+        M = np.empty((3, 3))
+        trks2D_into(float(tx), float(ty), float(angle_rad), float(kx), float(ky), float(sx), float(sy), M)
+        return M
+    # Closed form of T @ R @ K @ S: the linear block is R @ K with its columns scaled by sx and sy
+    c, s = cos_sin(angle_rad)
+    return np.array([[sx * (c - s * ky), sy * (c * kx - s), tx],
+                     [sx * (s + c * ky), sy * (s * kx + c), ty],
+                     [0,                 0,                 1]], dtype=dtype)
+
 
+def trks2D_batch(tx: ArrayLike, ty: ArrayLike, angle_rad: ArrayLike, kx: ArrayLike, ky: ArrayLike,
+                 sx: ArrayLike, sy: ArrayLike) -> np.ndarray:
+    """Creates one combined translation, rotation, shear, and scaling matrix per set of parameters.
+    
+    The parameters are broadcast against each other, so scalars can be mixed with arrays.
+    Each matrix is written in closed form: 8 multiplications instead of the 81 of T @ R @ K @ S.
+    
+    Returns:
+        An array of shape broadcast_shape + (3, 3) where [..., :, :] is trks2D of the
+        corresponding parameters.
+    
+    Examples:
+        >>> M = trks2D_batch(xs, ys, angles, 0.5, 0, 1, 1)  # one matrix per (x, y, angle)
+    """
+    tx, ty, angle_rad, kx, ky, sx, sy = np.broadcast_arrays(tx, ty, angle_rad, kx, ky, sx, sy)
+    c = np.cos(angle_rad)
+    s = np.sin(angle_rad)
+    M = np.zeros(angle_rad.shape + (3, 3), dtype=get_precision())
+    M[..., 0, 0] = sx * (c - s * ky)
+    M[..., 0, 1] = sy * (c * kx - s)
+    M[..., 0, 2] = tx
+    M[..., 1, 0] = sx * (s + c * ky)
+    M[..., 1, 1] = sy * (s * kx + c)
+    M[..., 1, 2] = ty
+    M[..., 2, 2] = 1
+    return M
 
 __all__ = [
     # Nothing to export explicitly, avoinding namespace conflictions
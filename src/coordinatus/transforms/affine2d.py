@@ -0,0 +1,133 @@
+"""Lightweight 2D affine transformation stored as six scalars."""
+
+from typing import Optional
+import numpy as np
+
+
+class Affine2D:
+    """A 2D affine transformation stored as six plain Python floats.
+
+    Represents the homogeneous matrix:
+        [[a, b, tx]
+         [c, d, ty]
+         [0, 0, 1 ]]
+
+    For a single 2D coordinate, numpy's per-call overhead (array construction,
+    dtype dispatch, ufunc setup) dominates the handful of multiplications that
+    are actually needed. Affine2D composes and applies transformations with
+    straight-line scalar arithmetic instead, and converts to a 3x3 numpy array
+    only at API boundaries.
+
+    Attributes:
+        a, b, c, d: Linear part (rotation, scale, shear) in row-major order.
+        tx, ty: Translation part.
+
+    Examples:
+        >>> affine = Affine2D.from_matrix(translate2D(5, 3))
+        >>> affine.apply_point(1, 2)
+        (6.0, 5.0)
+        >>> affine.apply_vector(1, 2)
+        (1.0, 2.0)
+    """
+
+    __slots__ = ('a', 'b', 'c', 'd', 'tx', 'ty')
+
+    def __init__(self, a: float, b: float, c: float, d: float, tx: float, ty: float):
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.tx = tx
+        self.ty = ty
+
+    @classmethod
+    def try_from_matrix(cls, matrix: np.ndarray) -> Optional['Affine2D']:
+        """Creates an Affine2D from a 3x3 matrix, or returns None if it is not affine.
+
+        A matrix is representable if it has shape (3, 3) and its bottom row is [0, 0, 1].
+        """
+        if matrix.shape != (3, 3):
+            return None
+        (a, b, tx), (c, d, ty), last_row = matrix.tolist()
+        if last_row != [0, 0, 1]:
+            return None
+        return cls(a, b, c, d, tx, ty)
+
+    @classmethod
+    def from_matrix(cls, matrix: np.ndarray) -> 'Affine2D':
+        """Creates an Affine2D from a 3x3 affine matrix in homogeneous coordinates.
+
+        Raises:
+            ValueError: If the matrix is not 3x3 or its bottom row is not [0, 0, 1].
+        """
+        affine = cls.try_from_matrix(np.asarray(matrix))
+        if affine is None:
+            raise ValueError("Matrix must be a 3x3 affine matrix with bottom row [0, 0, 1].")
+        return affine
+
+    def to_matrix(self) -> np.ndarray:
+        """Returns the equivalent 3x3 matrix in homogeneous coordinates."""
+        return np.array([[self.a, self.b, self.tx],
+                         [self.c, self.d, self.ty],
+                         [0.0,    0.0,    1.0]])
+
+    def __array__(self, dtype=None, copy=None):
+        """Return the 3x3 matrix for numpy operations."""
+        matrix = self.to_matrix()
+        if dtype is None:
+            return matrix
+        return matrix.astype(dtype)
+
+    def __matmul__(self, other: 'Affine2D') -> 'Affine2D':
+        """Composes two transformations: (self @ other) applies other first, then self."""
+        if not isinstance(other, Affine2D):
+            return NotImplemented
+        a, b, c, d = self.a, self.b, self.c, self.d
+        return Affine2D(
+            a * other.a + b * other.c,
+            a * other.b + b * other.d,
+            c * other.a + d * other.c,
+            c * other.b + d * other.d,
+            a * other.tx + b * other.ty + self.tx,
+            c * other.tx + d * other.ty + self.ty,
+        )
+
+    def inverse(self) -> 'Affine2D':
+        """Returns the inverse transformation, using the closed-form 2x2 inverse.
+
+        Raises:
+            np.linalg.LinAlgError: If the linear part is singular.
+        """
+        det = self.a * self.d - self.b * self.c
+        if det == 0:
+            raise np.linalg.LinAlgError("Singular matrix")
+        inv_det = 1.0 / det
+        a = self.d * inv_det
+        b = -self.b * inv_det
+        c = -self.c * inv_det
+        d = self.a * inv_det
+        return Affine2D(a, b, c, d,
+                        -(a * self.tx + b * self.ty),
+                        -(c * self.tx + d * self.ty))
+
+    def apply_point(self, x: float, y: float) -> tuple[float, float]:
+        """Transforms a point (weight=1): affected by the linear part and the translation."""
+        return (self.a * x + self.b * y + self.tx,
+                self.c * x + self.d * y + self.ty)
+
+    def apply_vector(self, x: float, y: float) -> tuple[float, float]:
+        """Transforms a vector (weight=0): affected by the linear part only."""
+        return (self.a * x + self.b * y,
+                self.c * x + self.d * y)
+
+    def __eq__(self, other):
+        """Check equality of all six coefficients."""
+        if not isinstance(other, Affine2D):
+            return NotImplemented
+        return (self.a, self.b, self.c, self.d, self.tx, self.ty) == \
+               (other.a, other.b, other.c, other.d, other.tx, other.ty)
+
+    def __repr__(self):
+        """String representation of the affine transformation."""
+        return (f"Affine2D(a={self.a!r}, b={self.b!r}, c={self.c!r}, d={self.d!r}, "
+                f"tx={self.tx!r}, ty={self.ty!r})")
@@ -1,26 +1,93 @@
 """Rotation transformation utilities."""
 
+from typing import Optional
 import numpy as np
+from numpy.typing import ArrayLike
 
+from .._transforms_numba import _HAS_NUMBA, cos_sin, rotate2D_into
+from ..precision import _SUPPORTED_DTYPES, _identity_3, get_precision
 
-def rotate2D(angle_rad: float) -> np.ndarray:
+
+def rotate2D(angle_rad: float, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Creates a 2D rotation matrix.
     
     Args:
         angle_rad: Rotation angle in radians (counter-clockwise)
+        out: Optional 3x3 array to write the matrix into, to avoid an allocation
     
     Returns:
         A 3x3 rotation matrix in homogeneous coordinates:
             [[cos(θ), -sin(θ), 0]
              [sin(θ),  cos(θ), 0]
              [0,       0,      1]]
+        cos(θ) and sin(θ) are exactly 0 at multiples of π/2.
+        A shared read-only identity is returned when the angle is 0 and `out` is not given.
+        Likewise, common angles such as π/2 or π return a shared read-only matrix.
+    """
+    if out is None:
+        if angle_rad == 0:
+            return _identity_3()
+        if isinstance(angle_rad, float):
+            common = _COMMON_ROTATIONS.get(angle_rad)
+            if common is not None:
+                return common[get_precision()]
+        out = np.empty((3, 3), dtype=get_precision())
+    if _HAS_NUMBA and out.dtype == np.float64 and out.shape == (3, 3):
+        rotate2D_into(float(angle_rad), out)
+        return out
+    c, s = cos_sin(angle_rad)
+    out[0, 0] = c
+    out[0, 1] = -s
+    out[0, 2] = 0
+    out[1, 0] = s
+    out[1, 1] = c
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 1
+    return out
+
+
+def _read_only_rotation(angle_rad: float, dtype: np.dtype) -> np.ndarray:
+    rotation = rotate2D(angle_rad, out=np.empty((3, 3), dtype=dtype))
+    rotation.setflags(write=False)
+    return rotation
+
+
+# Rotations by angles passed as literals all the time, looked up by exact value
+_COMMON_ANGLES = (np.pi / 4, np.pi / 2, np.pi, 3 * np.pi / 2, 2 * np.pi, -np.pi / 4, -np.pi / 2, -np.pi)
+_COMMON_ROTATIONS = {
+    angle: {dtype: _read_only_rotation(angle, dtype) for dtype in _SUPPORTED_DTYPES}
+    for angle in _COMMON_ANGLES
+}
+
+
+def rotate2D_batch(angles_rad: ArrayLike) -> np.ndarray:
     """
-    c = np.cos(angle_rad)
-    s = np.sin(angle_rad)
-    return np.array([[c, -s, 0],
-                     [s,  c, 0],
-                     [0,  0, 1]])
+    Creates one 2D rotation matrix per angle, with a single vectorized sin/cos evaluation.
+    
+    Args:
+        angles_rad: Rotation angles in radians (counter-clockwise), as an array of any shape
+    
+    Returns:
+        An array of shape angles_rad.shape + (3, 3) where [..., :, :] is rotate2D of
+        the corresponding angle.
+    
+    Examples:
+        >>> R = rotate2D_batch(np.linspace(0, np.pi, 100))  # shape (100, 3, 3)
+        >>> rotated = np.einsum('nij,nj->ni', R, homogeneous_points)
+    """
+    angles_rad = np.asarray(angles_rad)
+    c = np.cos(angles_rad)
+    s = np.sin(angles_rad)
+    M = np.zeros(angles_rad.shape + (3, 3), dtype=get_precision())
+    M[..., 0, 0] = c
+    M[..., 0, 1] = -s
+    M[..., 1, 0] = s
+    M[..., 1, 1] = c
+    M[..., 2, 2] = 1
+    return M
 
 
 def rotate3Dx(angle_rad: float) -> np.ndarray:
@@ -37,12 +104,14 @@ def rotate3Dx(angle_rad: float) -> np.ndarray:
              [0, sin(θ),  cos(θ),  0]
              [0, 0,       0,       1]]
     """
-    c = np.cos(angle_rad)
-    s = np.sin(angle_rad)
-    return np.array([[1, 0,  0, 0],
-                     [0, c, -s, 0],
-                     [0, s,  c, 0],
-                     [0, 0,  0, 1]])
+    c, s = cos_sin(angle_rad)
+    M = np.eye(4, dtype=get_precision())
+    M[1, 1] = c
+    M[1, 2] = -s
+    M[2, 1] = s
+    M[2, 2] = c
+    return M
+
 
 def rotate3Dy(angle_rad: float) -> np.ndarray:
     """
@@ -58,12 +127,14 @@ def rotate3Dy(angle_rad: float) -> np.ndarray:
              [-sin(θ), 0, cos(θ), 0]
              [0,       0, 0,      1]]
     """
-    c = np.cos(angle_rad)
-    s = np.sin(angle_rad)
-    return np.array([[ c, 0, s, 0],
-                     [ 0, 1, 0, 0],
-                     [-s, 0, c, 0],
-                     [ 0, 0, 0, 1]])
+    c, s = cos_sin(angle_rad)
+    M = np.eye(4, dtype=get_precision())
+    M[0, 0] = c
+    M[0, 2] = s
+    M[2, 0] = -s
+    M[2, 2] = c
+    return M
+
 
 def rotate3Dz(angle_rad: float) -> np.ndarray:
     """
@@ -79,9 +150,10 @@ def rotate3Dz(angle_rad: float) -> np.ndarray:
              [0,       0,      1, 0]
              [0,       0,      0, 1]]
     """
-    c = np.cos(angle_rad)
-    s = np.sin(angle_rad)
-    return np.array([[c, -s, 0, 0],
-                     [s,  c, 0, 0],
-                     [0,  0, 1, 0],
-                     [0,  0, 0, 1]])
\ No newline at end of file
+    c, s = cos_sin(angle_rad)
+    M = np.eye(4, dtype=get_precision())
+    M[0, 0] = c
+    M[0, 1] = -s
+    M[1, 0] = s
+    M[1, 1] = c
+    return M
\ No newline at end of file
@@ -1,8 +1,12 @@
 """Scaling and shearing transformation utilities."""
 
+from typing import Optional
 import numpy as np
 from numpy.typing import ArrayLike
 
+from ..precision import _identity_3, get_precision
+
+
 def scale(scale_vector: ArrayLike) -> np.ndarray:
     """
     Creates a scaling matrix for an n-dimensional space.
@@ -17,25 +21,44 @@ def scale(scale_vector: ArrayLike) -> np.ndarray:
     """
     scale_vector = np.asarray(scale_vector)
     assert scale_vector.ndim == 1, "scale_vector must be a 1D array"
-    homogeneous_scale_vector = np.append(scale_vector, 1)
-    return np.diagflat(homogeneous_scale_vector)
+    dim = scale_vector.shape[0]
+    S = np.eye(dim + 1, dtype=get_precision())
+    diagonal = np.arange(dim)
+    S[diagonal, diagonal] = scale_vector
+    return S
 
 
-def scale2D(sx: float, sy: float) -> np.ndarray:
+def scale2D(sx: float, sy: float, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Creates a 2D scaling matrix.
     
     Args:
         sx: Scale factor along the x-axis
         sy: Scale factor along the y-axis
+        out: Optional 3x3 array to write the matrix into, to avoid an allocation
     
     Returns:
         A 3x3 scaling matrix in homogeneous coordinates:
             [[sx, 0,  0]
              [0,  sy, 0]
              [0,  0,  1]]
+        A shared read-only identity is returned when both factors are 1 and `out` is not given.
     """
-    return scale([sx, sy])
+    if out is None:
+        if sx == 1 and sy == 1:
+            return _identity_3()
+        out = np.empty((3, 3), dtype=get_precision())
+    out[0, 0] = sx
+    out[0, 1] = 0
+    out[0, 2] = 0
+    out[1, 0] = 0
+    out[1, 1] = sy
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 1
+    return out
+
 
 def scale3D(sx: float, sy: float, sz: float) -> np.ndarray:
     """
@@ -56,8 +79,22 @@ def scale3D(sx: float, sy: float, sz: float) -> np.ndarray:
     return scale([sx, sy, sz])
 
 
-def shear2D(kx: float, ky: float) -> np.ndarray:
-    """Creates a 2D shear matrix."""
-    return np.array([[1, kx, 0],
-                     [ky, 1, 0],
-                     [0,  0, 1]])
+def shear2D(kx: float, ky: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Creates a 2D shear matrix, written into `out` if it is given.
+
+    A shared read-only identity is returned when both factors are 0 and `out` is not given.
+    """
+    if out is None:
+        if kx == 0 and ky == 0:
+            return _identity_3()
+        out = np.empty((3, 3), dtype=get_precision())
+    out[0, 0] = 1
+    out[0, 1] = kx
+    out[0, 2] = 0
+    out[1, 0] = ky
+    out[1, 1] = 1
+    out[1, 2] = 0
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 1
+    return out
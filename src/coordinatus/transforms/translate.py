@@ -1,41 +1,67 @@
 """Translation transformation utilities."""
 
+from typing import Optional
 import numpy as np
 from numpy.typing import ArrayLike
 
-def translate(translation_vector: ArrayLike) -> np.ndarray:
+from ..precision import _identity_3, get_precision
+
+
+def translate(translation_vector: ArrayLike, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Creates a translation matrix for an n-dimensional space.
     
     Args:
         translation_vector: Translation offsets for each dimension [tx, ty, ...]
+        out: Optional (n+1)x(n+1) array to write the matrix into, to avoid an allocation
     
     Returns:
         An (n+1)x(n+1) translation matrix in homogeneous coordinates where n is the
         length of translation_vector. The matrix translates points by the specified
-        offsets while leaving vectors (w=0) unchanged.
+        offsets while leaving vectors (w=0) unchanged. This is `out` if it was given.
     """
     translation_vector = np.asarray(translation_vector)
     dim = translation_vector.shape[0]
-    T = np.eye(dim + 1)
-    T[:-1, -1] = translation_vector
-    return T
+    if out is None:
+        out = np.eye(dim + 1, dtype=get_precision())
+    else:
+        out[...] = 0
+        np.fill_diagonal(out, 1)
+    out[:-1, -1] = translation_vector
+    return out
 
-def translate2D(tx: float, ty: float) -> np.ndarray:
+
+def translate2D(tx: float, ty: float, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Creates a 2D translation matrix.
     
     Args:
         tx: Translation offset along the x-axis
         ty: Translation offset along the y-axis
+        out: Optional 3x3 array to write the matrix into, to avoid an allocation
     
     Returns:
         A 3x3 translation matrix in homogeneous coordinates:
             [[1, 0, tx]
              [0, 1, ty]
              [0, 0, 1]]
+        A shared read-only identity is returned when both offsets are 0 and `out` is not given.
     """
-    return translate([tx, ty])
+    if out is None:
+        if tx == 0 and ty == 0:
+            return _identity_3()
+        out = np.empty((3, 3), dtype=get_precision())
+    out[0, 0] = 1
+    out[0, 1] = 0
+    out[0, 2] = tx
+    out[1, 0] = 0
+    out[1, 1] = 1
+    out[1, 2] = ty
+    out[2, 0] = 0
+    out[2, 1] = 0
+    out[2, 2] = 1
+    return out
+
 
 def translate3D(tx: float, ty: float, tz: float) -> np.ndarray:
     """
@@ -6,8 +6,9 @@ Requires matplotlib to be installed.
 Install with: pip install coordinatus[plotting]
 """
 
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Union, TYPE_CHECKING
 import numpy as np
+from numpy.typing import DTypeLike
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
@@ -19,8 +20,12 @@ except ImportError:  # pragma: no cover
     _HAS_MATPLOTLIB = False
     _Axes = None  # type: ignore
 
-from .frame import Frame
-from .coordinate import Point, Vector
+from .frame import ABSOLUTE_FRAME, Frame
+from .coordinate import Coordinate, Point, transform_point, transform_vector
+
+# Origin and unit axes of a frame, transformed as a point and as two vectors
+_ORIGIN = np.zeros(2)
+_UNIT_AXES = np.eye(2)
 
 
 def _check_matplotlib():
@@ -39,6 +44,7 @@ def draw_frame_axes(
     color: str = 'blue',
     label: str = 'Frame',
     alpha: float = 0.5,
+    dtype: DTypeLike = np.float32,
 ) -> None:
     """Draw a frame's origin and axes from a given reference frame's perspective.
     
@@ -48,6 +54,9 @@ def draw_frame_axes(
         reference_frame: The frame from which to view. If None, uses absolute coordinates.
         color: Color for the frame axes and origin.
         label: Label prefix for the legend.
+        alpha: Opacity of the frame axes and origin.
+        dtype: Floating point type of the plotted coordinates. float32 is precise enough
+               for plotting.
     
     Examples:
         >>> import matplotlib.pyplot as plt
@@ -63,38 +72,34 @@ def draw_frame_axes(
     
     # Use absolute frame if frame is None
     if frame is None:
-        frame = Frame()
+        frame = ABSOLUTE_FRAME
     
     # Use absolute frame if reference_frame is None
     if reference_frame is None:
-        reference_frame = Frame()
-    
-    # Get frame origin and unit vectors in reference frame
-    origin = Point(np.array([0, 0]), frame=frame)
-    x_axis = Vector(np.array([1, 0]), frame=frame)
-    y_axis = Vector(np.array([0, 1]), frame=frame)
-    
-    # Convert to reference frame coordinates
-    origin_coords = origin.relative_to(reference_frame).coords
-    x_axis_coords = x_axis.relative_to(reference_frame).coords
-    y_axis_coords = y_axis.relative_to(reference_frame).coords
+        reference_frame = ABSOLUTE_FRAME
+    
+    # Convert frame origin and unit vectors to reference frame coordinates. These are only
+    # three coordinates: they are converted at full precision and only cast for plotting
+    transform = frame._cached_relative_transform_to(reference_frame)
+    origin_coords = transform_point(transform, _ORIGIN).astype(dtype, copy=False)
+    axes_coords = transform_vector(transform, _UNIT_AXES).astype(dtype, copy=False)
+    x_axis_coords = axes_coords[:, 0]
+    y_axis_coords = axes_coords[:, 1]
 
     # Draw origin
     ax.plot(origin_coords[0], origin_coords[1], 'o', 
             color=color, label=f'{label} origin', zorder=5, alpha=alpha)
     
-    # Draw x-axis
+    # Draw both axes in one call: their tails are at the origin, their tips at origin + axis
+    tails = np.repeat(origin_coords[:, np.newaxis], 2, axis=1)
+    # Sizes in data units, matching the look of arrow patches with 0.1 wide and long heads
     head_size = 0.1
-    ax.arrow(origin_coords[0], origin_coords[1], 
-             x_axis_coords[0] * (1 - head_size), x_axis_coords[1] * (1 - head_size),
-             head_width=head_size, head_length=head_size,
-             fc=color, ec=color, alpha=alpha)
-    
-    # Draw y-axis
-    ax.arrow(origin_coords[0], origin_coords[1],
-             y_axis_coords[0] * (1 - head_size), y_axis_coords[1] * (1 - head_size),
-             head_width=head_size, head_length=head_size,
-             fc=color, ec=color, alpha=alpha)
+    ax.quiver(tails[0], tails[1], axes_coords[0], axes_coords[1],
+              angles='xy', scale_units='xy', scale=1, units='xy', width=0.01,
+              headwidth=head_size / 0.01, headlength=head_size / 0.01, headaxislength=head_size / 0.01,
+              color=color, alpha=alpha)
+    # Quiver only autoscales to the tails: include the tips like arrow patches would
+    ax.update_datalim((tails + axes_coords).T)
     
     # Label axes
     ax.text(origin_coords[0] + x_axis_coords[0] + 0.2,
@@ -107,23 +112,28 @@ def draw_frame_axes(
 
 def draw_points(
     ax: 'Axes',  # type: ignore[name-defined]
-    points: List[Point],
+    points: Union[Point, List[Point]],
     reference_frame: Optional[Frame] = None,
     color: str = 'red',
     label: str = 'Point',
     connect: bool = True,
-    show_labels: bool = True
+    show_labels: bool = True,
+    dtype: DTypeLike = np.float32,
 ) -> None:
     """Draw points from a given reference frame's perspective.
     
     Args:
         ax: Matplotlib axes to draw on.
-        points: List of Point objects to draw.
+        points: List of Point objects to draw, or a single Point holding a DxN batch of
+               points. A batch is stored as one array with a shared frame, so it is
+               converted without stacking individual points.
         reference_frame: The frame from which to view. If None, uses absolute coordinates.
         color: Color for the points and connecting lines.
         label: Label prefix for point annotations.
         connect: If True, connects points with lines.
         show_labels: If True, shows point labels (P1, P2, etc.).
+        dtype: Floating point type the points are converted and plotted in. float32 is
+               precise enough for plotting and halves the memory traffic of the conversion.
     
     Examples:
         >>> import matplotlib.pyplot as plt
@@ -137,25 +147,29 @@ def draw_points(
         ...     Point(np.array([1, 0]), frame)
         ... ]
         >>> draw_points(ax, points, color='red')
+        >>> draw_points(ax, Point(np.random.rand(2, 1000), frame), show_labels=False)
         >>> plt.show()
     """
     _check_matplotlib()
     
-    if not points:
+    if not isinstance(points, Point) and not points:
         return
     
     # Use absolute frame if reference_frame is None
     if reference_frame is None:
-        reference_frame = Frame()
+        reference_frame = ABSOLUTE_FRAME
     
-    # Get point coordinates in reference frame
-    coords = [p.relative_to(reference_frame).coords for p in points]
+    # Get point coordinates in reference frame, with one matrix product per source frame
+    coords = Coordinate.stack([points] if isinstance(points, Point) else points,
+                              frame=reference_frame, dtype=dtype).coords
+    if coords.shape[1] == 0:
+        return
     
-    xs = [c[0] for c in coords]
-    ys = [c[1] for c in coords]
+    xs = coords[0]
+    ys = coords[1]
     
     # Draw connecting lines
-    if connect and len(points) > 1:
+    if connect and coords.shape[1] > 1:
         ax.plot(xs, ys, '-', color=color, zorder=10, linewidth=2, alpha=0.5)
     
     # Draw points
@@ -166,4 +180,4 @@ def draw_points(
         for i, (x, y) in enumerate(zip(xs, ys), 1):
             ax.text(x + 0.1, y + 0.1, f'{label} {i}',
                     fontsize=10, color=color, fontweight='bold')
-            
\ No newline at end of file
+
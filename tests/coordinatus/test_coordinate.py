@@ -1,10 +1,11 @@
 """Unit tests for the Coordinate, Point, and Vector classes."""
 
 import numpy as np
-from coordinatus.coordinate import Coordinate, Point, Vector, transform_coordinate
-from coordinatus.frame import Frame
+import pytest
+from coordinatus.coordinate import Coordinate, Point, Vector, transform_coordinate, transform_point, transform_vector
+from coordinatus.frame import ABSOLUTE_FRAME, Frame
 from coordinatus.types import CoordinateKind
-from coordinatus.transforms import translate2D, rotate2D, scale2D
+from coordinatus.transforms import translate2D, rotate2D, scale2D, translate3D, rotate3Dz, project_xyz_to_xy
 
 
 class TestTransformCoordinate:
@@ -68,6 +69,135 @@ class TestTransformCoordinate:
         expected = np.array([8, 15])
         np.testing.assert_array_almost_equal(result, expected)
 
+    def test_transform_integer_coordinates_returns_float(self):
+        """Test that integer inputs produce a float result."""
+        transform = np.array([[1, 0, 2],
+                              [0, 1, 3],
+                              [0, 0, 1]])
+        result = transform_coordinate(transform, np.array([1, 1]), CoordinateKind.POINT)
+
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, [3, 4])
+
+    def test_transform_point_projective(self):
+        """Test that non-affine transforms still normalize by the homogeneous weight."""
+        transform = np.array([[1, 0, 0],
+                              [0, 1, 0],
+                              [0, 0, 2]])
+        result = transform_coordinate(transform, np.array([4, 6]), CoordinateKind.POINT)
+
+        expected = np.array([2, 3])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_transform_projective_single_matches_batch(self):
+        """Test that single coordinates and batches agree under a perspective transform."""
+        transform = np.array([[2, 1, 3],
+                              [0, 1, -1],
+                              [1, 2, 4]])
+        coords = np.array([[1, -2, 0],
+                           [2, 1, 0]])
+
+        for kind in (CoordinateKind.POINT, CoordinateKind.VECTOR):
+            batch = transform_coordinate(transform, coords, kind)
+            for i in range(coords.shape[1]):
+                single = transform_coordinate(transform, coords[:, i], kind)
+                assert single.dtype == np.float64
+                np.testing.assert_array_almost_equal(single, batch[:, i])
+
+    def test_transform_projective_batch_weights(self):
+        """Test that zero weights are left unnormalized and the weight row is dropped."""
+        transform = np.array([[1.0, 0.0, 0.0],
+                              [0.0, 1.0, 0.0],
+                              [1.0, 0.0, 0.0]])
+        coords = np.array([[2.0, 0.0],
+                           [4.0, 5.0]])
+        np.testing.assert_array_almost_equal(transform_point(transform, coords), [[1, 0], [2, 5]])
+
+        # Perspective projection from 2D to 1D: x' = x / (x + 1)
+        projection = np.array([[1.0, 0.0, 0.0],
+                               [1.0, 0.0, 1.0]])
+        result = transform_point(projection, np.array([[1.0, 3.0], [5.0, 7.0]]))
+        np.testing.assert_array_almost_equal(result, [[0.5, 0.75]])
+
+    @pytest.mark.parametrize("parallel_min_n", [100_000, 0])
+    def test_transform_float_batches_match_homogeneous(self, monkeypatch, parallel_min_n):
+        """Test float batches under affine and projective transforms, serial or threaded."""
+        monkeypatch.setattr("coordinatus.coordinate._PARALLEL_MIN_N", parallel_min_n)
+        coords = np.array([[1.0, -2.0, 0.5],
+                           [2.0, 1.0, -3.0]])
+        homogeneous = np.vstack([coords, np.ones(3)])
+
+        for transform in (np.array([[2.0, 1.0, 3.0], [0.0, 1.0, -1.0], [1.0, 2.0, 4.0]]),
+                          translate2D(5, 3) @ rotate2D(0.4)):
+            expected = transform @ homogeneous
+            expected = expected[:2] / expected[2]
+            np.testing.assert_array_almost_equal(transform_point(transform, coords), expected)
+
+    def test_transform_batch_into_out(self):
+        """Test that a DxN batch is written into a preallocated output array."""
+        transform = translate2D(5, 3) @ rotate2D(np.pi / 2)
+        coords = np.array([[1, 0, 2],
+                           [0, 1, 2]])
+        out = np.empty((2, 3))
+        result = transform_coordinate(transform, coords, CoordinateKind.POINT, out=out)
+
+        assert result is out
+        expected = np.array([[5, 4, 3],
+                             [4, 3, 5]])
+        np.testing.assert_array_almost_equal(out, expected)
+
+    def test_transform_single_into_out(self):
+        """Test that single coordinates and projective transforms also fill the output array."""
+        out = np.empty(2)
+        result = transform_coordinate(translate2D(5, 3), np.array([1, 2]), CoordinateKind.VECTOR, out=out)
+        assert result is out
+        np.testing.assert_array_almost_equal(out, [1, 2])
+
+        transform = np.diag([1.0, 1.0, 2.0])
+        result = transform_coordinate(transform, np.array([4, 6]), CoordinateKind.POINT, out=out)
+        assert result is out
+        np.testing.assert_array_almost_equal(out, [2, 3])
+
+
+class TestTransformPointAndVector:
+    """Tests for the kind-specialized transform_point and transform_vector functions."""
+
+    def test_transform_point(self):
+        """Test that points are rotated and translated."""
+        transform = translate2D(5, 3) @ rotate2D(np.pi / 2)
+        coords = np.array([[1, 0],
+                           [0, 1]])
+
+        result = transform_point(transform, coords)
+
+        expected = np.array([[5, 4],
+                             [4, 3]])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_transform_vector(self):
+        """Test that vectors are rotated but not translated."""
+        transform = translate2D(5, 3) @ rotate2D(np.pi / 2)
+        coords = np.array([[1, 0],
+                           [0, 1]])
+
+        result = transform_vector(transform, coords)
+
+        expected = np.array([[0, -1],
+                             [1, 0]])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_matches_transform_coordinate(self):
+        """Test that both functions match transform_coordinate for single and projective inputs."""
+        transforms = [translate2D(5, 3) @ scale2D(2, 3), np.diag([1.0, 1.0, 2.0])]
+        for transform in transforms:
+            for coords in [np.array([4, 6]), np.array([[4, 1], [6, 2]])]:
+                np.testing.assert_array_almost_equal(
+                    transform_point(transform, coords),
+                    transform_coordinate(transform, coords, CoordinateKind.POINT))
+                np.testing.assert_array_almost_equal(
+                    transform_vector(transform, coords),
+                    transform_coordinate(transform, coords, CoordinateKind.VECTOR))
+
 
 class TestCoordinateInit:
     """Tests for Coordinate initialization."""
@@ -86,6 +216,14 @@ class TestCoordinateInit:
         assert coord.frame.parent is None
         np.testing.assert_array_equal(coord.frame.transform, np.eye(3))
 
+    def test_coordinate_init_no_system_shares_absolute_frame(self):
+        """Test that coordinates created without a frame share the absolute frame."""
+        point = Point(np.array([1, 2]))
+        vector = Vector(np.array([3, 4]))
+
+        assert point.frame is ABSOLUTE_FRAME
+        assert vector.frame is ABSOLUTE_FRAME
+
     def test_coordinate_init_with_system(self):
         """Test creating a coordinate with a custom frame."""
         frame = Frame(transform=translate2D(5, 3), parent=None)
@@ -200,6 +338,7 @@ class TestCoordinateToAbsolute:
         # Result should be in identity/absolute frame
         assert result.frame.parent is None
         np.testing.assert_array_almost_equal(result.frame.transform, np.eye(3))
+        assert result.frame is ABSOLUTE_FRAME
 
     def test_to_global_one_level(self):
         """Test to_absolute with one parent level."""
@@ -486,6 +625,46 @@ class TestDxNArraySupport:
         expected = np.array([[1, 2, 3], [2, 4, 6]])
         np.testing.assert_array_almost_equal(result.coords, expected)
 
+    def test_transform_multiple_3d_points(self):
+        """Test transforming multiple 3D points with a 4x4 affine transform."""
+        transform = translate3D(1, 2, 3) @ rotate3Dz(np.pi / 2)
+        coords = np.array([[1, 0], [0, 1], [0, 0]])  # 2 points: (1,0,0) and (0,1,0)
+        result = transform_coordinate(transform, coords, CoordinateKind.POINT)
+
+        expected = np.array([[1, 0], [3, 2], [3, 3]])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_transform_multiple_points_projection(self):
+        """Test transforming multiple points with a dimension-changing projection."""
+        transform = project_xyz_to_xy() @ translate3D(1, 2, 3)
+        coords = np.array([[0, 1], [0, 1], [0, 1]])
+        result = transform_coordinate(transform, coords, CoordinateKind.POINT)
+
+        expected = np.array([[1, 2], [2, 3]])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_transform_multiple_points_projective(self):
+        """Test that non-affine transforms normalize each column by its weight."""
+        transform = np.array([[1, 0, 0],
+                              [0, 1, 0],
+                              [1, 0, 1]])
+        coords = np.array([[1, 3], [2, 4]])
+        result = transform_coordinate(transform, coords, CoordinateKind.POINT)
+
+        expected = np.array([[1 / 2, 3 / 4], [2 / 2, 4 / 4]])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_transform_multiple_integer_coordinates_returns_float(self):
+        """Test that integer inputs produce a float result."""
+        transform = np.array([[1, 0, 2],
+                              [0, 1, 3],
+                              [0, 0, 1]])
+        coords = np.array([[1, 2], [3, 4]])
+        result = transform_coordinate(transform, coords, CoordinateKind.POINT)
+
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, [[3, 4], [6, 7]])
+
     def test_single_point_still_works(self):
         """Test that single point (2,) still works after DxN implementation."""
         transform = translate2D(5, 3)
@@ -746,7 +925,6 @@ class TestCoordinateBaseClassOperations:
         assert result.kind == CoordinateKind.POINT
         np.testing.assert_array_almost_equal(result.coords, [4, 6])
 
-
     def test_vector_operations(self):
         """Test operations on vectors preserve vector type."""
         vector = Vector([1, 0])
@@ -1203,3 +1381,105 @@ class TestCoordinateDimensionProperties:
         coord = Coordinate(CoordinateKind.VECTOR, (9, 10))
         assert coord.N == 1
 
+
+class TestCoordinateStack:
+    """Tests for stacking coordinates into a single DxN coordinate."""
+
+    def test_stack_single_coordinates(self):
+        """Test that single coordinates become the columns of the stacked coordinate."""
+        frame = Frame(transform=translate2D(5, 3))
+        points = [Point([0, 0], frame), Point([1, 0], frame), Point([0, 1], frame)]
+
+        batch = Coordinate.stack(points)
+
+        assert isinstance(batch, Point)
+        assert batch.frame is frame
+        np.testing.assert_array_equal(batch.coords, [[0, 1, 0], [0, 0, 1]])
+
+    def test_stack_batches(self):
+        """Test that DxN batches and single coordinates can be mixed."""
+        vectors = [Vector([[1, 2], [3, 4]]), Vector([5, 6])]
+
+        batch = Coordinate.stack(vectors)
+
+        assert batch.kind == CoordinateKind.VECTOR
+        assert batch.N == 3
+        np.testing.assert_array_equal(batch.coords, [[1, 2, 5], [3, 4, 6]])
+
+    def test_stacked_conversion_matches_individual(self):
+        """Test that converting the stack matches converting each coordinate."""
+        frame = Frame(transform=translate2D(5, 3) @ rotate2D(np.pi / 3))
+        target = Frame(transform=scale2D(2, 4))
+        points = [Point([1, 2], frame), Point([-3, 4], frame)]
+
+        batch = Coordinate.stack(points).relative_to(target)
+
+        for i, point in enumerate(points):
+            np.testing.assert_array_almost_equal(batch.coords[:, i], point.relative_to(target).coords)
+
+    def test_stack_different_frames_raises(self):
+        """Test that coordinates from different frames cannot be stacked."""
+        points = [Point([0, 0], Frame(transform=translate2D(1, 0))), Point([1, 0])]
+
+        with pytest.raises(ValueError):
+            Coordinate.stack(points)
+
+    def test_stack_different_kinds_raises(self):
+        """Test that points and vectors cannot be stacked."""
+        with pytest.raises(ValueError):
+            Coordinate.stack([Point([0, 0]), Vector([1, 0])])
+
+    def test_stack_empty_raises(self):
+        """Test that an empty sequence cannot be stacked."""
+        with pytest.raises(ValueError):
+            Coordinate.stack([])
+
+    def test_stack_into_frame_from_different_frames(self):
+        """Test that coordinates from different frames are converted to the target frame."""
+        frame_a = Frame(transform=translate2D(5, 3))
+        frame_b = Frame(transform=rotate2D(np.pi / 2), parent=frame_a)
+        target = Frame(transform=scale2D(2, 4))
+        points = [Point([1, 2], frame_a), Point([[3, 4], [5, 6]], frame_b), Point([-1, 0], frame_a)]
+
+        batch = Coordinate.stack(points, frame=target)
+
+        assert batch.frame is target
+        expected = np.column_stack([point.relative_to(target).coords for point in points])
+        np.testing.assert_array_almost_equal(batch.coords, expected)
+
+    def test_stack_into_frame_single_source(self):
+        """Test that coordinates sharing a frame are converted in one product."""
+        frame = Frame(transform=translate2D(5, 3))
+        vectors = [Vector([1, 0], frame), Vector([0, 1], frame)]
+
+        batch = Coordinate.stack(vectors, frame=ABSOLUTE_FRAME)
+
+        assert isinstance(batch, Vector)
+        assert batch.frame is ABSOLUTE_FRAME
+        np.testing.assert_array_almost_equal(batch.coords, np.eye(2))
+
+    def test_stack_dtype(self):
+        """Test that the conversion runs in the given dtype, for one or several source frames."""
+        frame_a = Frame(transform=translate2D(5, 3))
+        frame_b = Frame(transform=scale2D(2, 2))
+        single_source = [Point([1, 2], frame_a), Point([[3], [4]], frame_a)]
+        several_sources = [Point([1, 2], frame_a), Point([[3], [4]], frame_b)]
+
+        batch = Coordinate.stack(single_source, frame=ABSOLUTE_FRAME, dtype=np.float32)
+        assert batch.coords.dtype == np.float32
+        np.testing.assert_array_equal(batch.coords, [[6, 8], [5, 7]])
+
+        batch = Coordinate.stack(several_sources, frame=ABSOLUTE_FRAME, dtype=np.float32)
+        assert batch.coords.dtype == np.float32
+        np.testing.assert_array_equal(batch.coords, [[6, 6], [5, 8]])
+
+        assert Coordinate.stack(single_source, dtype=np.float32).coords.dtype == np.float32
+
+    def test_stack_into_frame_projection(self):
+        """Test that the result takes its dimension from the conversion, not from the inputs."""
+        frame = Frame(transform=project_xyz_to_xy())
+        points = [Point([1, 2, 3], frame), Point([4, 5, 6], frame)]
+
+        np.testing.assert_array_equal(Coordinate.stack(points, frame=ABSOLUTE_FRAME).coords, [[1, 4], [2, 5]])
+        np.testing.assert_array_equal(Coordinate.stack(points[:1], frame=ABSOLUTE_FRAME, dtype=np.float32).coords,
+                                      [[1], [2]])
@@ -1,7 +1,11 @@
 """Unit tests for the Frame class."""
 
+import copy
+import pickle
 import numpy as np
-from coordinatus.frame import Frame, create_frame
+import pytest
+from coordinatus import frame as frame_module
+from coordinatus.frame import ABSOLUTE_FRAME, Frame, create_frame
 from coordinatus.transforms import translate2D, rotate2D, scale2D, trs2D
 
 
@@ -28,6 +32,27 @@ class TestFrameInit:
         np.testing.assert_array_equal(child.transform, child_transform)
         np.testing.assert_array_equal(child.parent.transform, parent_transform)
 
+    def test_frame_init_default_identity_shared(self):
+        """Test that default frames share one read-only identity matrix."""
+        frame1 = Frame()
+        frame2 = Frame()
+
+        assert frame1.transform is frame2.transform
+        np.testing.assert_array_equal(frame1.transform, np.eye(3))
+        with pytest.raises(ValueError):
+            frame1.transform[0, 2] = 5
+
+    def test_absolute_frame_is_frozen(self):
+        """Test that the shared absolute frame cannot be modified."""
+        assert ABSOLUTE_FRAME.parent is None
+        assert ABSOLUTE_FRAME == Frame()
+
+        with pytest.raises(AttributeError):
+            ABSOLUTE_FRAME.transform = translate2D(1, 0)
+        with pytest.raises(AttributeError):
+            ABSOLUTE_FRAME.parent = Frame()
+        np.testing.assert_array_equal(ABSOLUTE_FRAME.transform, np.eye(3))
+
 
 class TestFrameDimensions:
     """Tests for Frame.D_in and Frame.D_out properties."""
@@ -122,7 +147,6 @@ class TestFrameDimensions:
         assert frame.D_out == 1
 
 
-
 class TestFrameEquality:
     """Tests for Frame equality comparison."""
 
@@ -264,6 +288,155 @@ class TestComputeAbsoluteTransform:
         np.testing.assert_array_almost_equal(result, expected)
 
 
+class TestAbsoluteTransformCache:
+    """Tests for memoization of compute_absolute_transform."""
+
+    def test_repeated_calls_reuse_result(self):
+        """Test that the absolute transform is not recomputed when nothing changed."""
+        parent = Frame(transform=translate2D(10, 5))
+        child = Frame(transform=rotate2D(np.pi / 2), parent=parent)
+
+        assert child.compute_absolute_transform() is child.compute_absolute_transform()
+
+    def test_cached_result_is_read_only(self):
+        """Test that the shared cached result cannot be modified in place."""
+        parent = Frame(transform=translate2D(10, 5))
+        child = Frame(transform=translate2D(3, 2), parent=parent)
+
+        result = child.compute_absolute_transform()
+        assert not result.flags.writeable
+
+    def test_own_transform_change_invalidates(self):
+        """Test that assigning a new transform updates the absolute transform."""
+        parent = Frame(transform=translate2D(10, 5))
+        child = Frame(transform=translate2D(3, 2), parent=parent)
+        child.compute_absolute_transform()
+
+        child.transform = translate2D(1, 1)
+
+        expected = translate2D(10, 5) @ translate2D(1, 1)
+        np.testing.assert_array_almost_equal(child.compute_absolute_transform(), expected)
+
+    def test_ancestor_transform_change_invalidates(self):
+        """Test that changing a grandparent transform propagates to grandchildren."""
+        grandparent = Frame(transform=translate2D(10, 0))
+        parent = Frame(transform=translate2D(5, 0), parent=grandparent)
+        child = Frame(transform=translate2D(2, 0), parent=parent)
+        child.compute_absolute_transform()
+
+        grandparent.transform = translate2D(-10, 0)
+
+        expected = translate2D(-10, 0) @ translate2D(5, 0) @ translate2D(2, 0)
+        np.testing.assert_array_almost_equal(child.compute_absolute_transform(), expected)
+        np.testing.assert_array_almost_equal(parent.compute_absolute_transform(),
+                                             translate2D(-10, 0) @ translate2D(5, 0))
+
+    def test_reparenting_invalidates(self):
+        """Test that assigning a new parent updates the absolute transform."""
+        parent_a = Frame(transform=translate2D(10, 0))
+        parent_b = Frame(transform=translate2D(0, 10))
+        child = Frame(transform=translate2D(1, 1), parent=parent_a)
+        child.compute_absolute_transform()
+
+        child.parent = parent_b
+
+        expected = translate2D(0, 10) @ translate2D(1, 1)
+        np.testing.assert_array_almost_equal(child.compute_absolute_transform(), expected)
+
+    def test_former_parent_change_ignored_after_reparenting(self):
+        """Test that a reparented frame no longer follows its former parent."""
+        parent_a = Frame(transform=translate2D(10, 0))
+        parent_b = Frame(transform=translate2D(0, 10))
+        child = Frame(transform=translate2D(1, 1), parent=parent_a)
+        child.parent = parent_b
+        cached = child.compute_absolute_transform()
+
+        parent_a.transform = translate2D(-5, 0)
+
+        assert child.compute_absolute_transform() is cached
+
+    def test_change_keeps_other_branches_cached(self):
+        """Test that a transform change only invalidates the frame's own subtree."""
+        root = Frame(transform=translate2D(1, 0))
+        branch_a = Frame(transform=translate2D(2, 0), parent=root)
+        branch_b = Frame(transform=translate2D(3, 0), parent=root)
+        leaf_a = Frame(transform=translate2D(4, 0), parent=branch_a)
+        leaf_b = Frame(transform=translate2D(5, 0), parent=branch_b)
+        cached_b = leaf_b.compute_absolute_transform()
+        leaf_a.compute_absolute_transform()
+
+        branch_a.transform = translate2D(20, 0)
+
+        assert leaf_b.compute_absolute_transform() is cached_b
+        np.testing.assert_array_almost_equal(leaf_a.compute_absolute_transform(), translate2D(25, 0))
+
+    def test_chain_with_projective_transform(self):
+        """Test that a stale chain containing a projective transform is composed correctly."""
+        root = Frame(transform=translate2D(1, 0))
+        middle = Frame(transform=np.array([[1.0, 0, 0], [0, 1, 0], [0.5, 0, 1]]), parent=root)
+        child = Frame(transform=rotate2D(np.pi / 3), parent=middle)
+        leaf = Frame(transform=scale2D(2, 3), parent=child)
+
+        expected = root.transform @ middle.transform @ child.transform @ leaf.transform
+        np.testing.assert_array_almost_equal(leaf.compute_absolute_transform(), expected)
+        np.testing.assert_array_almost_equal(child.compute_absolute_transform(),
+                                             root.transform @ middle.transform @ child.transform)
+
+    def test_deepcopy_follows_copied_parent(self):
+        """Test that a deep copy is invalidated by its copied parent, and not by the original one."""
+        parent = Frame(transform=translate2D(1, 0))
+        child = Frame(transform=translate2D(0, 1), parent=parent)
+        child.compute_absolute_transform()
+
+        copied = copy.deepcopy(child)
+        copied.compute_absolute_transform()
+        assert copied.parent is not None
+        copied.parent.transform = translate2D(100, 0)
+        np.testing.assert_array_almost_equal(copied.compute_absolute_transform(), translate2D(100, 1))
+
+        parent.transform = translate2D(-1, 0)
+        np.testing.assert_array_almost_equal(copied.compute_absolute_transform(), translate2D(100, 1))
+        np.testing.assert_array_almost_equal(child.compute_absolute_transform(), translate2D(-1, 1))
+
+    def test_pickle_round_trip(self):
+        """Test that frames pickle, and that unpickled frames are invalidated by their parent."""
+        parent = Frame(transform=translate2D(1, 0))
+        child = Frame(transform=rotate2D(np.pi / 2), parent=parent)
+        child.compute_absolute_transform()
+
+        restored = pickle.loads(pickle.dumps(child))
+        np.testing.assert_array_equal(restored.compute_absolute_transform(), child.compute_absolute_transform())
+        restored.parent.transform = translate2D(5, 0)
+        np.testing.assert_array_almost_equal(restored.compute_absolute_transform(),
+                                             translate2D(5, 0) @ rotate2D(np.pi / 2))
+
+    def test_absolute_frame_copies_are_itself(self):
+        """Test that copying or unpickling the absolute frame returns the shared instance."""
+        assert copy.deepcopy(ABSOLUTE_FRAME) is ABSOLUTE_FRAME
+        assert copy.copy(ABSOLUTE_FRAME) is ABSOLUTE_FRAME
+        assert pickle.loads(pickle.dumps(ABSOLUTE_FRAME)) is ABSOLUTE_FRAME
+
+    def test_deep_hierarchy(self):
+        """Test that deep hierarchies do not hit the recursion limit."""
+        frame = Frame()
+        for _ in range(5000):
+            frame = Frame(transform=translate2D(1, 0), parent=frame)
+
+        expected = translate2D(5000, 0)
+        np.testing.assert_array_almost_equal(frame.compute_absolute_transform(), expected)
+
+    def test_cycle_raises(self):
+        """Test that a frame cannot become its own ancestor."""
+        parent = Frame()
+        child = Frame(parent=parent)
+
+        with pytest.raises(ValueError):
+            parent.parent = child
+        with pytest.raises(ValueError):
+            parent.parent = parent
+        assert parent.parent is None
+
+
 class TestComputeRelativeTransformTo:
     """Tests for the compute_relative_transform_to method."""
 
@@ -363,6 +536,91 @@ class TestComputeRelativeTransformTo:
         point_in_b = result @ point_in_a
         np.testing.assert_array_almost_equal(point_in_b, [10, -10, 1])
 
+    def test_convert_transform_matches_linalg_inverse(self):
+        """Test that the relative transform matches the explicit inverse formula."""
+        frame_a = create_frame(None, tx=3, ty=-2, angle_rad=np.pi / 5, sx=2, sy=0.5)
+        frame_b = create_frame(None, tx=-1, ty=4, angle_rad=-np.pi / 3, sx=1.5, sy=3)
+
+        result = frame_a.compute_relative_transform_to(frame_b)
+        expected = np.linalg.inv(frame_b.transform) @ frame_a.transform
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_convert_transform_between_close_relatives(self):
+        """Test conversions to self, parent, child and sibling frames against the absolute formula."""
+        root = create_frame(None, tx=7, ty=-3, angle_rad=0.4, sx=3, sy=2)
+        parent = create_frame(root, tx=3, ty=-2, angle_rad=np.pi / 5, sx=2, sy=0.5)
+        child = create_frame(parent, tx=-1, ty=4, angle_rad=-np.pi / 3, sx=1.5, sy=3)
+        sibling = create_frame(parent, tx=2, ty=2, angle_rad=1.0, sx=0.5, sy=1)
+
+        pairs = [(child, child), (child, parent), (parent, child), (child, sibling), (root, Frame())]
+        for source, target in pairs:
+            result = source.compute_relative_transform_to(target)
+            expected = np.linalg.inv(target.compute_absolute_transform()) @ source.compute_absolute_transform()
+            np.testing.assert_array_almost_equal(result, expected)
+
+    def test_convert_transform_to_parent_is_a_copy(self):
+        """Test that converting to the parent does not return the frame's own matrix."""
+        parent = Frame()
+        child = Frame(transform=translate2D(1, 2), parent=parent)
+
+        result = child.compute_relative_transform_to(parent)
+        result[0, 2] = 100
+
+        np.testing.assert_array_equal(child.transform, translate2D(1, 2))
+
+    def test_convert_transform_projective_and_singular_target(self):
+        """Test that projective targets are inverted and singular targets raise."""
+        frame_a = Frame(transform=translate2D(1, 2))
+        projective = Frame(transform=np.diag([1.0, 1.0, 2.0]))
+        singular = Frame(transform=scale2D(0, 1))
+
+        result = frame_a.compute_relative_transform_to(projective)
+        np.testing.assert_array_almost_equal(result, np.linalg.inv(projective.transform) @ frame_a.transform)
+        with pytest.raises(np.linalg.LinAlgError):
+            frame_a.compute_relative_transform_to(singular)
+
+
+class TestRelativeTransformCache:
+    """Tests for the cache of relative transforms used by coordinate conversions."""
+
+    def test_repeated_conversion_reuses_result(self):
+        """Test that the cached transform is shared and read-only, unlike the public method."""
+        source = create_frame(create_frame(None, tx=1), angle_rad=0.5)
+        target = create_frame(create_frame(None, ty=2), sx=2)
+
+        cached = source._cached_relative_transform_to(target)
+
+        assert source._cached_relative_transform_to(target) is cached
+        assert not cached.flags.writeable
+        assert source.compute_relative_transform_to(target).flags.writeable
+        np.testing.assert_array_almost_equal(cached, source.compute_relative_transform_to(target))
+
+    def test_ancestor_changes_invalidate(self):
+        """Test that changing an ancestor of either frame, or reparenting, updates the result."""
+        root = Frame()
+        source_parent = Frame(transform=translate2D(1, 0), parent=root)
+        source = Frame(transform=rotate2D(0.5), parent=source_parent)
+        target_parent = Frame(transform=translate2D(0, 1), parent=root)
+        target = Frame(transform=scale2D(2, 2), parent=target_parent)
+
+        for change in (lambda: setattr(source_parent, 'transform', translate2D(5, 0)),
+                       lambda: setattr(target_parent, 'transform', rotate2D(1.0)),
+                       lambda: setattr(root, 'transform', scale2D(3, 1)),
+                       lambda: setattr(target, 'parent', source_parent)):
+            source._cached_relative_transform_to(target)
+            change()
+            np.testing.assert_array_almost_equal(source._cached_relative_transform_to(target),
+                                                 source.compute_relative_transform_to(target))
+
+    def test_cache_is_bounded(self):
+        """Test that old entries are evicted once the cache is full."""
+        target = Frame()
+        frames = [create_frame(None, tx=i) for i in range(frame_module._RELATIVE_CACHE_SIZE + 10)]
+        for frame in frames:
+            frame._cached_relative_transform_to(target)
+
+        assert len(frame_module._relative_cache) == frame_module._RELATIVE_CACHE_SIZE
+
 
 class TestCreateFrame:
     """Tests for the create_frame function."""
@@ -0,0 +1,71 @@
+"""Unit tests for the working precision setting."""
+
+import numpy as np
+import pytest
+from coordinatus import Coordinate, Frame, Point, get_precision, set_precision
+from coordinatus.transforms import (
+    translate2D, rotate2D, scale2D, shear2D, trs2D, trks2D, translate, scale, rotate3Dx, rotate3Dy, rotate3Dz,
+)
+
+
+@pytest.fixture
+def float32_precision():
+    """Switches to float32 precision for one test, then restores the previous one."""
+    previous = get_precision()
+    set_precision(np.float32)
+    yield
+    set_precision(previous)
+
+
+class TestPrecision:
+    """Tests for set_precision and get_precision."""
+
+    def test_default_is_float64(self):
+        """Test that the builders create float64 matrices by default."""
+        assert get_precision() == np.float64
+        assert trs2D(1, 2, 0.5, 2, 3).dtype == np.float64
+        assert Frame().transform.dtype == np.float64
+
+    def test_float32_builders(self, float32_precision):
+        """Test that the builders and default frames follow the float32 precision."""
+        matrices = [translate2D(1, 2), rotate2D(0.5), scale2D(2, 3), shear2D(0.5, 0),
+                    trs2D(1, 2, 0.5, 2, 3), trks2D(1, 2, 0.5, 0.1, 0, 2, 3), translate([1, 2, 3]),
+                    scale([1, 2, 3]), rotate3Dx(0.5), rotate3Dy(0.5), rotate3Dz(0.5), Frame().transform]
+        for matrix in matrices:
+            assert matrix.dtype == np.float32
+        np.testing.assert_allclose(trs2D(1, 2, 0.5, 2, 3), translate2D(1, 2) @ rotate2D(0.5) @ scale2D(2, 3),
+                                   rtol=1e-6)
+
+    def test_float32_identity(self, float32_precision):
+        """Test that identity parameters and common angles return matrices in the working precision."""
+        for matrix in (translate2D(0, 0), rotate2D(0), rotate2D(np.pi), scale2D(1, 1), shear2D(0, 0),
+                       trs2D(0, 0, 0, 1, 1)):
+            assert matrix.dtype == np.float32
+
+    def test_float32_conversion_is_not_upcast(self, float32_precision):
+        """Test that float32 frames and coordinates convert without upcasting."""
+        parent = Frame(transform=trs2D(5, 3, 0.3, 2, 2))
+        child = Frame(transform=translate2D(1, 0), parent=parent)
+        target = Frame(transform=rotate2D(0.7))
+        points = Point(np.array([[1, 2, 3], [4, 5, 6]], dtype=np.float32), frame=child)
+
+        assert points.to_absolute().coords.dtype == np.float32
+        assert points.relative_to(target).coords.dtype == np.float32
+        assert Point(np.array([1, 2], dtype=np.float32), frame=child).relative_to(target).coords.dtype == np.float32
+
+    def test_float32_stack_keeps_wider_groups(self, float32_precision):
+        """Test that stacking a float64 group after a float32 one does not downcast it."""
+        frame_a = Frame(transform=translate2D(1, 0))
+        frame_b = Frame(transform=translate2D(0, 1).astype(np.float64))
+        points = [Point(np.array([1, 2], dtype=np.float32), frame_a), Point(np.array([0.1, 0.2]), frame_b)]
+
+        batch = Coordinate.stack(points, frame=Frame(transform=scale2D(2, 2)))
+
+        assert batch.coords.dtype == np.float64
+        assert batch.coords[0, 1] == 0.05
+
+    def test_unsupported_precision_raises(self):
+        """Test that only float32 and float64 are accepted."""
+        with pytest.raises(ValueError):
+            set_precision(np.int32)
+        assert get_precision() == np.float64
@@ -0,0 +1,250 @@
+"""Unit tests for the optional Numba kernels.
+
+The kernels are exercised both in their compiled form (when numba is installed)
+and as plain Python functions, so the fallback stays covered either way.
+"""
+
+import numpy as np
+import pytest
+from coordinatus import _transforms_numba as nb
+from coordinatus.transforms import translate2D, rotate2D, scale2D, shear2D
+
+
+def _kernel_fixture(*names: str, parallel: bool = False):
+    """Creates a fixture returning the named kernels as used at runtime, or their pure Python source.
+
+    The fixture is parametrized over "compiled" and "python", plus "parallel" for batch
+    kernels that also have a multithreaded build. It returns a tuple of kernels, or the
+    kernel itself when a single name is given.
+    """
+    variants = [("compiled", "{}"), ("parallel", "{}_parallel"), ("python", "_{}")]
+    params = [pytest.param(tuple(getattr(nb, pattern.format(name)) for name in names), id=variant)
+              for variant, pattern in variants if parallel or variant != "parallel"]
+
+    @pytest.fixture(params=params)
+    def fixture(request):
+        return request.param if len(names) > 1 else request.param[0]
+    return fixture
+
+
+kernels = _kernel_fixture("apply_point_2d", "apply_vector_2d", "trs2D_into")
+cos_sin = _kernel_fixture("cos_sin")
+builder_kernels = _kernel_fixture("rotate2D_into", "trks2D_into")
+transform_2d_into = _kernel_fixture("transform_2d_into", parallel=True)
+transform_affine_2d_into = _kernel_fixture("transform_affine_2d_into", parallel=True)
+compose_affine_chain_into = _kernel_fixture("compose_affine_chain_2d_into")
+matrix_kernels = _kernel_fixture("compose_3x3_into", "invert_affine_2d_into", "relative_affine_2d_into")
+
+
+class TestApplyKernels:
+    """Tests for the single 2D coordinate kernels."""
+
+    def test_point_affected_by_translation(self, kernels):
+        """Test that points are translated."""
+        apply_point, _, _ = kernels
+        x, y = apply_point(translate2D(5, 3), 1.0, 2.0)
+        assert (x, y) == pytest.approx((6, 5))
+
+    def test_vector_unaffected_by_translation(self, kernels):
+        """Test that vectors ignore translation."""
+        _, apply_vector, _ = kernels
+        x, y = apply_vector(translate2D(5, 3) @ scale2D(2, 3), 1.0, 2.0)
+        assert (x, y) == pytest.approx((2, 6))
+
+    def test_point_normalized_by_weight(self, kernels):
+        """Test that projective matrices are normalized by the homogeneous weight."""
+        apply_point, _, _ = kernels
+        M = np.diag([1.0, 1.0, 2.0])
+        x, y = apply_point(M, 4.0, 6.0)
+        assert (x, y) == pytest.approx((2, 3))
+
+    def test_affine_matrix_skips_weight(self, kernels):
+        """Test that affine matrices give linear part plus translation, and vectors the linear part."""
+        apply_point, apply_vector, _ = kernels
+        M = translate2D(0.1, 0.2) @ shear2D(0.3, 0.7) @ scale2D(3.0, 0.1)
+        x, y = apply_point(M, 0.3, 0.7)
+        assert (x, y) == pytest.approx(M[:2, :2] @ [0.3, 0.7] + M[:2, 2])
+        x, y = apply_vector(M, 0.3, 0.7)
+        assert (x, y) == pytest.approx(M[:2, :2] @ [0.3, 0.7])
+
+    def test_vector_normalized_by_weight(self, kernels):
+        """Test that vectors are normalized when the bottom row makes their weight nonzero."""
+        _, apply_vector, _ = kernels
+        M = np.array([[1.0, 0, 0], [0, 1, 0], [1, 0, 1]])
+        x, y = apply_vector(M, 2.0, 4.0)
+        assert (x, y) == pytest.approx((1, 2))
+
+    def test_read_only_matrix(self, kernels):
+        """Test that read-only matrices are accepted."""
+        apply_point, _, _ = kernels
+        M = rotate2D(np.pi / 2)
+        M.setflags(write=False)
+        x, y = apply_point(M, 1.0, 0.0)
+        assert (x, y) == pytest.approx((0, 1))
+
+
+class TestTRSKernel:
+    """Tests for the closed-form TRS kernel."""
+
+    def test_matches_matrix_product(self, kernels):
+        """Test that the kernel matches T @ R @ S."""
+        _, _, trs_into = kernels
+        out = np.empty((3, 3))
+        trs_into(5.0, 3.0, np.pi / 3, 2.0, 1.5, out)
+        expected = translate2D(5, 3) @ rotate2D(np.pi / 3) @ scale2D(2, 1.5)
+        np.testing.assert_array_almost_equal(out, expected)
+
+
+class TestCosSin:
+    """Tests for the cos/sin helper used by the rotation builders."""
+
+    def test_exact_at_cardinal_angles(self, cos_sin):
+        """Test that rounding residuals at multiples of pi/2 are snapped to zero."""
+        assert cos_sin(np.pi / 2) == (0.0, 1.0)
+        assert cos_sin(-np.pi) == (-1.0, 0.0)
+        assert cos_sin(3 * np.pi / 2) == (0.0, -1.0)
+        assert cos_sin(1e-20) == (1.0, 1e-20)
+        assert cos_sin(np.pi / 2 + 1e-9)[0] == pytest.approx(-1e-9)
+
+    def test_non_finite_angles_give_nan(self, cos_sin):
+        """Test that infinite and NaN angles give NaN instead of raising."""
+        for angle in (np.inf, -np.inf, np.nan):
+            c, s = cos_sin(angle)
+            assert np.isnan(c) and np.isnan(s)
+
+    def test_large_angles_not_snapped(self, cos_sin):
+        """Test that the snapping tolerance does not grow with huge angles."""
+        for angle in (1e10, 1e15, 5e15, 1e17):
+            assert cos_sin(angle) == (np.cos(angle), np.sin(angle))
+
+
+class TestBuilderKernels:
+    """Tests for the rotation and TRKS matrix kernels."""
+
+    def test_rotate_matches_definition(self, builder_kernels):
+        """Test that the rotation kernel writes the full rotation matrix."""
+        rotate_into, _ = builder_kernels
+        out = np.full((3, 3), np.nan)
+        rotate_into(np.pi / 6, out)
+        c, s = np.cos(np.pi / 6), np.sin(np.pi / 6)
+        np.testing.assert_array_almost_equal(out, [[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+    def test_trks_matches_matrix_product(self, builder_kernels):
+        """Test that the TRKS kernel matches T @ R @ K @ S."""
+        _, trks_into = builder_kernels
+        out = np.full((3, 3), np.nan)
+        trks_into(-1.5, 4.0, 0.7, -0.2, 0.6, 3.0, 0.5, out)
+        expected = translate2D(-1.5, 4) @ rotate2D(0.7) @ shear2D(-0.2, 0.6) @ scale2D(3, 0.5)
+        np.testing.assert_array_almost_equal(out, expected)
+
+
+class TestTransformAffine2DKernel:
+    """Tests for the batched 2xN affine transform kernel."""
+
+    def test_matches_matmul(self, transform_affine_2d_into):
+        """Test points and vectors against the homogeneous matrix product."""
+        M = translate2D(5, 3) @ rotate2D(0.3) @ scale2D(2, 0.5)
+        coords = np.array([[1.0, -2.0, 0.5], [0.0, 3.0, 4.0]])
+        out = np.empty((2, 3))
+
+        for weight in (1.0, 0.0):
+            transform_affine_2d_into(M, coords, weight, out)
+            expected = M @ np.vstack([coords, np.full(3, weight)])
+            np.testing.assert_array_almost_equal(out, expected[:2])
+
+    def test_in_place(self, transform_affine_2d_into):
+        """Test that out may be the input array."""
+        coords = np.array([[1.0, 2.0], [3.0, 4.0]])
+        transform_affine_2d_into(translate2D(1, -1), coords, 1.0, coords)
+        np.testing.assert_array_equal(coords, [[2, 3], [2, 3]])
+
+
+class TestTransform2DKernel:
+    """Tests for the batched 2xN transform kernel."""
+
+    def test_points_and_vectors(self, transform_2d_into):
+        """Test that the weight selects point or vector semantics."""
+        M = translate2D(5, 3) @ rotate2D(np.pi / 2)
+        coords = np.array([[1.0, 0.0], [0.0, 2.0]])
+        out = np.empty((2, 2))
+
+        transform_2d_into(M, coords, 1.0, out)
+        np.testing.assert_array_almost_equal(out, [[5, 3], [4, 3]])
+        transform_2d_into(M, coords, 0.0, out)
+        np.testing.assert_array_almost_equal(out, [[0, -2], [1, 0]])
+
+    def test_projective_normalized_in_place(self, transform_2d_into):
+        """Test that columns are normalized by their weight, with out aliasing the input."""
+        M = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 0.0, 1.0]])
+        coords = np.array([[1.0, 3.0], [4.0, 8.0]])
+
+        transform_2d_into(M, coords, 1.0, coords)
+
+        np.testing.assert_array_almost_equal(coords, [[0.5, 0.75], [2, 2]])
+
+
+class TestComposeAffineChainKernel:
+    """Tests for the kernel composing a chain of affine transforms."""
+
+    def test_matches_running_products(self, compose_affine_chain_into):
+        """Test that out[i] is the product of the base and the first i + 1 transforms."""
+        base = translate2D(1, 2) @ rotate2D(0.3)
+        transforms = np.array([scale2D(2, 0.5), translate2D(-3, 4), rotate2D(-1.1) @ shear2D(0.2, 0.1)])
+        out = np.empty((3, 3, 3))
+
+        assert compose_affine_chain_into(base, transforms, out) == 0
+
+        expected = base
+        for i in range(3):
+            expected = expected @ transforms[i]
+            np.testing.assert_array_almost_equal(out[i], expected)
+
+    def test_rejects_non_affine(self, compose_affine_chain_into):
+        """Test that a projective matrix anywhere in the chain is reported and out is untouched."""
+        transforms = np.array([translate2D(1, 2), np.diag([1.0, 1.0, 2.0])])
+        out = np.zeros((2, 3, 3))
+
+        assert compose_affine_chain_into(np.eye(3), transforms, out) == 1
+        assert compose_affine_chain_into(np.diag([1.0, 1.0, 2.0]), transforms[:1], out) == 1
+        np.testing.assert_array_equal(out, np.zeros((2, 3, 3)))
+
+
+class TestMatrixKernels:
+    """Tests for the 3x3 compose and affine inverse kernels."""
+
+    def test_compose_matches_matmul(self, matrix_kernels):
+        """Test that composing matches the numpy matrix product."""
+        compose_into, _, _ = matrix_kernels
+        a = translate2D(5, 3) @ rotate2D(np.pi / 3)
+        b = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [0.5, 0.25, 2.0]])
+        out = np.empty((3, 3))
+        compose_into(a, b, out)
+        np.testing.assert_array_almost_equal(out, a @ b)
+
+    def test_invert_affine(self, matrix_kernels):
+        """Test that the affine inverse matches np.linalg.inv."""
+        _, invert_into, _ = matrix_kernels
+        m = translate2D(5, 3) @ rotate2D(np.pi / 3) @ scale2D(2, 0.5)
+        out = np.empty((3, 3))
+        assert invert_into(m, out) == 0
+        np.testing.assert_array_almost_equal(out, np.linalg.inv(m))
+
+    def test_invert_rejects_non_affine_and_singular(self, matrix_kernels):
+        """Test that non-affine and singular matrices are reported and out is untouched."""
+        _, invert_into, _ = matrix_kernels
+        out = np.zeros((3, 3))
+        assert invert_into(np.diag([1.0, 1.0, 2.0]), out) == 1
+        assert invert_into(scale2D(0, 1), out) == 2
+        np.testing.assert_array_equal(out, np.zeros((3, 3)))
+
+    def test_relative_matches_inverse_product(self, matrix_kernels):
+        """Test that the fused kernel matches inv(target) @ source, including projective sources."""
+        _, _, relative_into = matrix_kernels
+        target = translate2D(5, 3) @ rotate2D(np.pi / 3) @ scale2D(2, 0.5)
+        source = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [0.5, 0.25, 2.0]])
+        out = np.empty((3, 3))
+        assert relative_into(target, source, out) == 0
+        np.testing.assert_array_almost_equal(out, np.linalg.inv(target) @ source)
+
+        assert relative_into(np.diag([1.0, 1.0, 2.0]), source, out) == 1
+        assert relative_into(scale2D(0, 1), source, out) == 2
@@ -1,72 +1,128 @@
 """Unit tests for visualization functions."""
 
-from unittest.mock import Mock
+from typing import TYPE_CHECKING, cast
+
 import numpy as np
 
 from coordinatus import Frame, Point, create_frame
+from coordinatus.transforms import project_xyz_to_xy
 from coordinatus.visualization import draw_frame_axes, draw_points
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+class RecordingAxes:
+    """Stand-in for matplotlib axes that records the (args, kwargs) of each drawing call.
+
+    Plain methods appending to lists are much cheaper than Mock attribute lookups.
+    """
+
+    def __init__(self):
+        self.plot_calls = []
+        self.quiver_calls = []
+        self.text_calls = []
+        self.datalim_calls = []
+
+    def plot(self, *args, **kwargs):
+        self.plot_calls.append((args, kwargs))
+
+    def quiver(self, *args, **kwargs):
+        self.quiver_calls.append((args, kwargs))
+
+    def text(self, *args, **kwargs):
+        self.text_calls.append((args, kwargs))
+
+    def update_datalim(self, *args, **kwargs):
+        self.datalim_calls.append((args, kwargs))
+
+
+def as_axes(recorder: RecordingAxes) -> 'Axes':
+    """Returns the recorder typed as the matplotlib axes it stands in for."""
+    return cast('Axes', recorder)
+
 
 class TestDrawFrameAxes:
     """Tests for the draw_frame_axes function."""
 
     def test_draws_origin(self):
         """Test that origin point is drawn."""
-        ax = Mock()
+        ax = RecordingAxes()
         frame = Frame()
-        
-        draw_frame_axes(ax, frame, color='blue', label='Test')
-        
-        ax.plot.assert_called()
+
+        draw_frame_axes(as_axes(ax), frame, color='blue', label='Test')
+
+        assert ax.plot_calls
         # First plot call is the origin
-        first_call = ax.plot.call_args_list[0]
-        assert first_call[1]['color'] == 'blue'
-        assert 'origin' in first_call[1]['label']
+        _, kwargs = ax.plot_calls[0]
+        assert kwargs['color'] == 'blue'
+        assert 'origin' in kwargs['label']
 
     def test_draws_arrows_for_axes(self):
         """Test that x and y axis arrows are drawn."""
-        ax = Mock()
+        ax = RecordingAxes()
         frame = Frame()
-        
-        draw_frame_axes(ax, frame)
-        
-        assert ax.arrow.call_count == 2  # x-axis and y-axis
+
+        draw_frame_axes(as_axes(ax), frame)
+
+        # x-axis and y-axis in a single call
+        assert len(ax.quiver_calls) == 1
+        args, _ = ax.quiver_calls[0]
+        assert all(np.shape(arg) == (2,) for arg in args)
 
     def test_draws_axis_labels(self):
         """Test that axis labels are drawn."""
-        ax = Mock()
+        ax = RecordingAxes()
         frame = Frame()
-        
-        draw_frame_axes(ax, frame, label='MyFrame')
-        
-        assert ax.text.call_count == 2
-        text_calls = [c[0][2] for c in ax.text.call_args_list]
+
+        draw_frame_axes(as_axes(ax), frame, label='MyFrame')
+
+        assert len(ax.text_calls) == 2
+        text_calls = [args[2] for args, _ in ax.text_calls]
         assert 'MyFrame X' in text_calls
         assert 'MyFrame Y' in text_calls
 
     def test_none_frame_uses_absolute(self):
         """Test that None frame draws the absolute/world frame."""
-        ax = Mock()
-        
-        draw_frame_axes(ax, None)
-        
+        ax = RecordingAxes()
+
+        draw_frame_axes(as_axes(ax), None)
+
         # Origin should be at (0, 0)
-        first_call = ax.plot.call_args_list[0]
-        assert first_call[0][0] == 0  # x
-        assert first_call[0][1] == 0  # y
+        args, _ = ax.plot_calls[0]
+        assert args[0] == 0  # x
+        assert args[1] == 0  # y
 
     def test_respects_color_parameter(self):
         """Test that color is applied to all elements."""
-        ax = Mock()
-        
-        draw_frame_axes(ax, Frame(), color='red')
-        
+        ax = RecordingAxes()
+
+        draw_frame_axes(as_axes(ax), Frame(), color='red')
+
         # Check origin color
-        assert ax.plot.call_args_list[0][1]['color'] == 'red'
+        assert ax.plot_calls[0][1]['color'] == 'red'
         # Check arrow colors
-        for arrow_call in ax.arrow.call_args_list:
-            assert arrow_call[1]['fc'] == 'red'
-            assert arrow_call[1]['ec'] == 'red'
+        assert ax.quiver_calls[0][1]['color'] == 'red'
+
+    def test_converts_to_reference_frame(self):
+        """Test the origin and axis arrows of a rotated frame seen from a translated reference."""
+        ax = RecordingAxes()
+        frame = create_frame(parent=None, tx=2, ty=1, angle_rad=np.pi / 2)
+        reference = create_frame(parent=None, tx=1, ty=0)
+
+        draw_frame_axes(as_axes(ax), frame, reference_frame=reference)
+
+        x, y = ax.plot_calls[0][0][:2]
+        assert (x, y) == (1, 1)
+        # Tails x, tails y, then the x and y components of the x-axis and y-axis arrows
+        args, _ = ax.quiver_calls[0]
+        np.testing.assert_array_almost_equal(args, [[1, 1], [1, 1], [0, -1], [1, 0]])
+        # Both arrow tips are included in the data limits
+        np.testing.assert_array_almost_equal(ax.datalim_calls[0][0][0], [[1, 2], [0, 1]])
+        assert x.dtype == np.float32
+
+        draw_frame_axes(as_axes(ax), frame, reference_frame=reference, dtype=np.float64)
+        assert ax.plot_calls[-1][0][0].dtype == np.float64
 
 
 class TestDrawPoints:
@@ -74,80 +130,145 @@ class TestDrawPoints:
 
     def test_draws_single_point(self):
         """Test drawing a single point."""
-        ax = Mock()
+        ax = RecordingAxes()
         point = Point(np.array([1, 2]), frame=Frame())
-        
-        draw_points(ax, [point], color='red')
-        
-        ax.plot.assert_called()
+
+        draw_points(as_axes(ax), [point], color='red')
+
+        assert ax.plot_calls
 
     def test_empty_points_does_nothing(self):
         """Test that empty point list doesn't crash."""
-        ax = Mock()
-        
-        draw_points(ax, [])
-        
-        ax.plot.assert_not_called()
+        ax = RecordingAxes()
+
+        draw_points(as_axes(ax), [])
+
+        assert not ax.plot_calls
 
     def test_connects_multiple_points(self):
         """Test that multiple points are connected with lines."""
-        ax = Mock()
+        ax = RecordingAxes()
         frame = Frame()
         points = [
             Point(np.array([0, 0]), frame=frame),
             Point(np.array([1, 1]), frame=frame),
         ]
-        
-        draw_points(ax, points, connect=True)
-        
+
+        draw_points(as_axes(ax), points, connect=True)
+
         # Should have line plot and point plot
-        assert ax.plot.call_count == 2
+        assert len(ax.plot_calls) == 2
 
     def test_no_connect_option(self):
         """Test that connect=False skips line drawing."""
-        ax = Mock()
+        ax = RecordingAxes()
         frame = Frame()
         points = [
             Point(np.array([0, 0]), frame=frame),
             Point(np.array([1, 1]), frame=frame),
         ]
-        
-        draw_points(ax, points, connect=False)
-        
+
+        draw_points(as_axes(ax), points, connect=False)
+
         # Should only have point plot, no line
-        assert ax.plot.call_count == 1
+        assert len(ax.plot_calls) == 1
 
     def test_shows_labels(self):
         """Test that point labels are shown."""
-        ax = Mock()
+        ax = RecordingAxes()
         points = [Point(np.array([0, 0]), frame=Frame())]
-        
-        draw_points(ax, points, label='P', show_labels=True)
-        
-        ax.text.assert_called()
-        assert 'P 1' in ax.text.call_args[0][2]
+
+        draw_points(as_axes(ax), points, label='P', show_labels=True)
+
+        assert ax.text_calls
+        assert 'P 1' in ax.text_calls[-1][0][2]
 
     def test_hides_labels(self):
         """Test that show_labels=False hides labels."""
-        ax = Mock()
+        ax = RecordingAxes()
         points = [Point(np.array([0, 0]), frame=Frame())]
-        
-        draw_points(ax, points, show_labels=False)
-        
-        ax.text.assert_not_called()
+
+        draw_points(as_axes(ax), points, show_labels=False)
+
+        assert not ax.text_calls
 
     def test_respects_reference_frame(self):
         """Test that points are transformed to reference frame."""
-        ax = Mock()
+        ax = RecordingAxes()
         # Point at (0,0) in a frame translated by (5, 3)
         frame = create_frame(parent=None, tx=5, ty=3)
         point = Point(np.array([0, 0]), frame=frame)
-        
+
         # View from absolute frame
-        draw_points(ax, [point], reference_frame=None, connect=False, show_labels=False)
-        
+        draw_points(as_axes(ax), [point], reference_frame=None, connect=False, show_labels=False)
+
         # Point should appear at (5, 3) in absolute coords
-        plot_call = ax.plot.call_args
-        xs, ys = plot_call[0][0], plot_call[0][1]
+        xs, ys = ax.plot_calls[-1][0][:2]
         np.testing.assert_array_almost_equal(xs, [5])
         np.testing.assert_array_almost_equal(ys, [3])
+
+    def test_points_from_different_frames(self):
+        """Test that points from several frames keep their order once converted."""
+        ax = RecordingAxes()
+        frame_a = create_frame(parent=None, tx=5, ty=3)
+        frame_b = create_frame(parent=None, tx=-1, ty=2)
+        points = [
+            Point(np.array([0, 0]), frame=frame_a),
+            Point(np.array([1, 0]), frame=frame_b),
+            Point(np.array([0, 1]), frame=frame_a),
+        ]
+
+        draw_points(as_axes(ax), points, connect=False, show_labels=False)
+
+        xs, ys = ax.plot_calls[-1][0][:2]
+        np.testing.assert_array_almost_equal(xs, [5, 0, 5])
+        np.testing.assert_array_almost_equal(ys, [3, 2, 4])
+
+    def test_point_batch(self):
+        """Test that a single Point holding a DxN batch is drawn as N points."""
+        ax = RecordingAxes()
+        frame = create_frame(parent=None, tx=5, ty=3)
+        points = Point(np.array([[0, 1, 2], [0, 0, 1]]), frame=frame)
+
+        draw_points(as_axes(ax), points, label='P')
+
+        assert len(ax.plot_calls) == 2
+        xs, ys = ax.plot_calls[-1][0][:2]
+        np.testing.assert_array_almost_equal(xs, [5, 6, 7])
+        np.testing.assert_array_almost_equal(ys, [3, 3, 4])
+        assert len(ax.text_calls) == 3
+        assert 'P 3' in ax.text_calls[-1][0][2]
+
+    def test_single_point_coordinate(self):
+        """Test that a Point holding one 1D coordinate is drawn without a connecting line."""
+        ax = RecordingAxes()
+
+        draw_points(as_axes(ax), Point(np.array([1, 2])), show_labels=False)
+
+        assert len(ax.plot_calls) == 1
+        np.testing.assert_array_almost_equal(ax.plot_calls[0][0][0], [1])
+
+    def test_dtype(self):
+        """Test that coordinates are plotted as float32 by default, or in the given dtype."""
+        frame = create_frame(parent=None, tx=5, ty=3)
+        batch = Point(np.array([[0.0, 1.0], [0.0, 2.0]]), frame=frame)
+        mixed = [Point(np.array([0.0, 0.0]), frame=frame), batch, Point(np.array([1.0, 1.0]))]
+        for points in (batch, [Point(np.array([0.0, 0.0]), frame=frame)], mixed):
+            ax = RecordingAxes()
+            draw_points(as_axes(ax), points, show_labels=False)
+            assert ax.plot_calls[-1][0][0].dtype == np.float32
+
+            ax = RecordingAxes()
+            draw_points(as_axes(ax), points, show_labels=False, dtype=np.float64)
+            assert ax.plot_calls[-1][0][0].dtype == np.float64
+
+        np.testing.assert_array_equal(ax.plot_calls[-1][0][:2], [[5, 5, 6, 1], [3, 3, 5, 1]])
+
+    def test_projected_points(self):
+        """Test that points in a 3D frame projected to 2D are drawn with their projected coordinates."""
+        ax = RecordingAxes()
+        frame = Frame(transform=project_xyz_to_xy())
+
+        draw_points(as_axes(ax), [Point([1, 2, 3], frame)], show_labels=False)
+
+        np.testing.assert_array_equal(ax.plot_calls[-1][0][:2], [[1], [2]])
@@ -0,0 +1,91 @@
+"""Unit tests for the Affine2D class."""
+
+import numpy as np
+import pytest
+from coordinatus.transforms import Affine2D, translate2D, rotate2D, scale2D, trs2D
+
+
+class TestAffine2DConversion:
+    """Tests for converting between Affine2D and 3x3 matrices."""
+
+    def test_from_matrix_round_trip(self):
+        """Test that converting a matrix to Affine2D and back preserves it."""
+        M = trs2D(5, 3, np.pi / 3, 2, 1.5)
+        affine = Affine2D.from_matrix(M)
+        np.testing.assert_array_almost_equal(affine.to_matrix(), M)
+
+    def test_coefficient_layout(self):
+        """Test that coefficients map to the expected matrix entries."""
+        affine = Affine2D(1, 2, 3, 4, 5, 6)
+        expected = np.array([[1, 2, 5],
+                             [3, 4, 6],
+                             [0, 0, 1]])
+        np.testing.assert_array_equal(affine.to_matrix(), expected)
+
+    def test_as_numpy_array(self):
+        """Test that Affine2D can be used where a numpy array is expected."""
+        affine = Affine2D.from_matrix(translate2D(5, 3))
+        np.testing.assert_array_equal(np.asarray(affine), translate2D(5, 3))
+        assert np.asarray(affine, dtype=np.float32).dtype == np.float32
+
+    def test_from_matrix_rejects_projective(self):
+        """Test that a matrix with a non-affine bottom row is rejected."""
+        M = np.eye(3)
+        M[2, 0] = 1
+        assert Affine2D.try_from_matrix(M) is None
+        with pytest.raises(ValueError):
+            Affine2D.from_matrix(M)
+
+    def test_from_matrix_rejects_wrong_shape(self):
+        """Test that non-3x3 matrices are rejected."""
+        assert Affine2D.try_from_matrix(np.eye(4)) is None
+        with pytest.raises(ValueError):
+            Affine2D.from_matrix(np.eye(4))
+
+
+class TestAffine2DOperations:
+    """Tests for composing and applying Affine2D transformations."""
+
+    def test_compose_matches_matrix_product(self):
+        """Test that @ composes in the same order as matrix multiplication."""
+        A = trs2D(5, 3, np.pi / 3, 2, 1.5)
+        B = trs2D(-1, 2, np.pi / 7, 0.5, 3)
+        result = Affine2D.from_matrix(A) @ Affine2D.from_matrix(B)
+        np.testing.assert_array_almost_equal(result.to_matrix(), A @ B)
+
+    def test_apply_point(self):
+        """Test that points are affected by translation."""
+        affine = Affine2D.from_matrix(translate2D(5, 3) @ rotate2D(np.pi / 2))
+        x, y = affine.apply_point(1, 0)
+        assert x == pytest.approx(5)
+        assert y == pytest.approx(4)
+
+    def test_apply_vector(self):
+        """Test that vectors ignore translation."""
+        affine = Affine2D.from_matrix(translate2D(5, 3) @ scale2D(2, 3))
+        assert affine.apply_vector(1, 1) == (2, 3)
+
+    def test_inverse_matches_linalg_inv(self):
+        """Test that the closed-form inverse matches np.linalg.inv."""
+        M = trs2D(5, 3, np.pi / 3, 2, 1.5)
+        result = Affine2D.from_matrix(M).inverse()
+        np.testing.assert_array_almost_equal(result.to_matrix(), np.linalg.inv(M))
+
+    def test_inverse_composes_to_identity(self):
+        """Test that composing with the inverse yields the identity."""
+        affine = Affine2D(1, 2, 3, 4, 5, 6)
+        np.testing.assert_array_almost_equal((affine @ affine.inverse()).to_matrix(), np.eye(3))
+
+    def test_inverse_singular_raises(self):
+        """Test that inverting a singular transformation raises like np.linalg.inv."""
+        with pytest.raises(np.linalg.LinAlgError):
+            Affine2D.from_matrix(scale2D(0, 1)).inverse()
+
+    def test_equality(self):
+        """Test equality comparison of coefficients."""
+        assert Affine2D(1, 0, 0, 1, 2, 3) == Affine2D(1, 0, 0, 1, 2, 3)
+        assert Affine2D(1, 0, 0, 1, 2, 3) != Affine2D(1, 0, 0, 1, 2, 4)
+
+    def test_repr(self):
+        """Test string representation."""
+        assert repr(Affine2D(1, 0, 0, 1, 2, 3)) == "Affine2D(a=1, b=0, c=0, d=1, tx=2, ty=3)"
@@ -15,6 +15,7 @@ from coordinatus.transforms import (
     augment_dim,
 )
 
+
 class TestSwapAxes:
     """Tests for the swap_axes function."""
 
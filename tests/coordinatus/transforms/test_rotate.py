@@ -1,8 +1,9 @@
 """Unit tests for transformation matrix functions."""
 
 import numpy as np
+import pytest
 from coordinatus.transforms import (
-    rotate2D, rotate3Dx, rotate3Dy, rotate3Dz,
+    rotate2D, rotate2D_batch, rotate3Dx, rotate3Dy, rotate3Dz,
 )
 
 
@@ -70,6 +71,89 @@ class TestRotate2D:
                             [0,  0, 1]])
         np.testing.assert_array_almost_equal(R, expected)
 
+    def test_rotate_out(self):
+        """Test that the matrix is written into a reused buffer."""
+        out = np.full((3, 3), np.nan)
+        R = rotate2D(np.pi / 3, out=out)
+        assert R is out
+        np.testing.assert_array_almost_equal(out, rotate2D(np.pi / 3))
+
+    def test_rotate2D_zero_returns_shared_identity(self):
+        """Test that a zero angle returns the shared read-only identity."""
+        R = rotate2D(0)
+        assert R is rotate2D(0.0)
+        assert not R.flags.writeable
+        np.testing.assert_array_equal(R, np.eye(3))
+
+    def test_rotate2D_cardinal_angles_are_exact(self):
+        """Test that multiples of 90 degrees give exact zeros instead of rounding residuals."""
+        expected = {
+            np.pi / 2: [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
+            np.pi: [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
+            -np.pi / 2: [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
+            2 * np.pi: np.eye(3),
+            200 * np.pi: np.eye(3),
+        }
+        for angle, matrix in expected.items():
+            np.testing.assert_array_equal(rotate2D(angle), matrix)
+        np.testing.assert_array_equal(rotate3Dz(np.pi / 2)[:2, :2], [[0, -1], [1, 0]])
+
+    def test_rotate2D_common_angles_are_shared(self):
+        """Test that common angles return a shared read-only matrix, and a fresh one with out."""
+        R = rotate2D(np.pi / 2)
+        assert R is rotate2D(np.pi / 2)
+        assert not R.flags.writeable
+        np.testing.assert_array_equal(R, [[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+        c = np.sqrt(2) / 2
+        np.testing.assert_array_almost_equal(rotate2D(-np.pi / 4), [[c, c, 0], [-c, c, 0], [0, 0, 1]])
+
+        out = np.empty((3, 3))
+        assert rotate2D(np.pi / 2, out=out) is out
+        np.testing.assert_array_equal(out, R)
+
+    def test_rotate2D_large_angle_stays_orthonormal(self):
+        """Test that huge angles still give a rotation, not a zeroed linear block."""
+        for angle in (1e15, 5e15, 1e17):
+            R = rotate2D(angle)[:2, :2]
+            assert np.linalg.det(R) == pytest.approx(1)
+            np.testing.assert_array_almost_equal(R @ R.T, np.eye(2))
+
+    def test_rotate_infinite_angle_gives_nan(self):
+        """Test that infinite angles give NaN rotation blocks, like np.cos and np.sin."""
+        assert np.isnan(rotate2D(np.inf)[:2, :2]).all()
+        assert np.isnan(rotate3Dz(-np.inf)[:2, :2]).all()
+
+    def test_rotate2D_small_angle_kept(self):
+        """Test that the sine of a tiny angle is not snapped to zero."""
+        assert rotate2D(1e-20)[1, 0] == 1e-20
+
+
+class TestRotate2DBatch:
+    """Tests for the vectorized rotate2D_batch function."""
+
+    def test_matches_rotate2D(self):
+        """Test that each matrix matches rotate2D of the same angle."""
+        angles = np.array([0, np.pi / 6, np.pi / 2, -1.3])
+        R = rotate2D_batch(angles)
+
+        assert R.shape == (4, 3, 3)
+        for angle, matrix in zip(angles, R):
+            np.testing.assert_array_almost_equal(matrix, rotate2D(angle))
+
+    def test_preserves_input_shape(self):
+        """Test that scalar and multi-dimensional angle arrays keep their shape."""
+        assert rotate2D_batch(0.5).shape == (3, 3)
+        assert rotate2D_batch(np.zeros((2, 5))).shape == (2, 5, 3, 3)
+
+    def test_rotate_points(self):
+        """Test rotating one point per angle with einsum."""
+        R = rotate2D_batch([np.pi / 2, np.pi])
+        points = np.array([[1, 0, 1], [0, 1, 1]])
+
+        rotated = np.einsum('nij,nj->ni', R, points)
+
+        np.testing.assert_array_almost_equal(rotated, [[0, 1, 1], [0, -1, 1]])
+
 
 class TestRotate3Dx:
     """Tests for the rotate3Dx function (rotation around X-axis)."""
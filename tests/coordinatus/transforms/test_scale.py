@@ -5,6 +5,7 @@ from coordinatus.transforms import (
     scale, scale2D, scale3D, shear2D,
 )
 
+
 class TestScale2D:
     """Tests for the scale2D function."""
 
@@ -62,6 +63,20 @@ class TestScale2D:
                             [0,    0,    1]])
         np.testing.assert_array_almost_equal(S, expected)
 
+    def test_scale_out(self):
+        """Test that the matrix is written into a reused buffer."""
+        out = np.full((3, 3), np.nan)
+        S = scale2D(2, 3, out=out)
+        assert S is out
+        np.testing.assert_array_equal(out, np.diag([2, 3, 1]))
+
+    def test_scale2D_unit_returns_shared_identity(self):
+        """Test that unit factors return the shared read-only identity."""
+        S = scale2D(1, 1)
+        assert S is scale2D(1.0, 1.0)
+        assert not S.flags.writeable
+        np.testing.assert_array_equal(S, np.eye(3))
+
 
 class TestShear2D:
     """Tests for the shear2D function."""
@@ -128,6 +143,20 @@ class TestShear2D:
         expected = np.array([3, 3, 0])  # x += y*0.5, y += x*0.5
         np.testing.assert_array_almost_equal(result, expected)
 
+    def test_shear_out(self):
+        """Test that the matrix is written into a reused buffer."""
+        out = np.full((3, 3), np.nan)
+        K = shear2D(0.5, 0.25, out=out)
+        assert K is out
+        np.testing.assert_array_equal(out, [[1, 0.5, 0], [0.25, 1, 0], [0, 0, 1]])
+
+    def test_shear2D_zero_returns_shared_identity(self):
+        """Test that zero shear factors return the shared read-only identity."""
+        K = shear2D(0, 0)
+        assert K is shear2D(0.0, 0.0)
+        assert not K.flags.writeable
+        np.testing.assert_array_equal(K, np.eye(3))
+
 
 class TestScale:
     """Tests for the general n-dimensional scale function."""
@@ -2,9 +2,10 @@
 
 import numpy as np
 from coordinatus.transforms import (
-    translate2D, rotate2D, scale2D, shear2D, trs2D, trks2D,
+    translate2D, rotate2D, scale2D, shear2D, trs2D, trs2D_batch, trks2D, trks2D_batch,
 )
 
+
 class TestTRS2D:
     """Tests for the trs2D combined transformation function."""
 
@@ -49,6 +50,18 @@ class TestTRS2D:
         
         np.testing.assert_array_almost_equal(M, expected)
 
+    def test_trs_matches_matrix_product(self):
+        """Test that the closed form matches T @ R @ S for various parameters."""
+        params = [
+            (0, 0, 0, 1, 1),
+            (-3.5, 7.25, -np.pi / 6, 0.5, 4),
+            (100, -20, 5 * np.pi / 3, -1, 2),
+            (1e-3, 1e3, 1e-8, 1e-3, 1e3),
+        ]
+        for tx, ty, angle, sx, sy in params:
+            expected = translate2D(tx, ty) @ rotate2D(angle) @ scale2D(sx, sy)
+            np.testing.assert_allclose(trs2D(tx, ty, angle, sx, sy), expected, rtol=1e-12, atol=1e-12)
+
     def test_trs_transform_point(self):
         """Test TRS transformation on a point: scale, then rotate, then translate."""
         # Start with point (1, 0)
@@ -88,6 +101,42 @@ class TestTRS2D:
         # Shape should be 3x3
         assert M.shape == (3, 3)
 
+    def test_trs_identity_is_shared(self):
+        """Test that identity parameters return one shared read-only matrix."""
+        M = trs2D(0, 0, 0, 1, 1)
+        assert M is trks2D(0, 0, 0, 0, 0, 1, 1)
+        assert not M.flags.writeable
+
+    def test_trs_cardinal_angle_is_exact(self):
+        """Test that a quarter turn has no rounding residuals."""
+        np.testing.assert_array_equal(trs2D(1, 2, np.pi / 2, 2, 3), [[0, -3, 1], [2, 0, 2], [0, 0, 1]])
+        np.testing.assert_array_equal(trks2D(1, 2, np.pi / 2, 0.5, 0, 2, 3), [[0, -3, 1], [2, 1.5, 2], [0, 0, 1]])
+
+
+class TestTRS2DBatch:
+    """Tests for the vectorized trs2D_batch function."""
+
+    def test_matches_trs2D(self):
+        """Test that each matrix matches trs2D of the same parameters."""
+        tx = np.array([0, 5, -2])
+        ty = np.array([1, 3, 4])
+        angles = np.array([0, np.pi / 3, -0.7])
+        sx = np.array([1, 2, 0.5])
+        sy = np.array([1, 1.5, 3])
+
+        M = trs2D_batch(tx, ty, angles, sx, sy)
+
+        assert M.shape == (3, 3, 3)
+        for i in range(3):
+            np.testing.assert_array_almost_equal(M[i], trs2D(tx[i], ty[i], angles[i], sx[i], sy[i]))
+
+    def test_broadcasts_scalars(self):
+        """Test that scalar parameters are broadcast against arrays."""
+        M = trs2D_batch([1, 2], 0, [0.1, 0.2], 1, 2)
+
+        assert M.shape == (2, 3, 3)
+        np.testing.assert_array_almost_equal(M[1], trs2D(2, 0, 0.2, 1, 2))
+
 
 class TestTRKS2D:
     """Tests for the trks2D combined transformation function."""
@@ -138,7 +187,15 @@ class TestTRKS2D:
         K = shear2D(kx, ky)
         S = scale2D(sx, sy)
         expected = T @ R @ K @ S
-        
+
+        np.testing.assert_array_almost_equal(M, expected)
+
+    def test_trks_matches_matrix_product(self):
+        """Test the closed form against T * R * K * S with distinct parameters."""
+        M = trks2D(-1.5, 4, 0.7, -0.2, 0.6, 3, 0.5)
+
+        expected = translate2D(-1.5, 4) @ rotate2D(0.7) @ shear2D(-0.2, 0.6) @ scale2D(3, 0.5)
+        assert M.dtype == np.float64
         np.testing.assert_array_almost_equal(M, expected)
 
     def test_trks_equals_trs_when_no_shear(self):
@@ -150,7 +207,7 @@ class TestTRKS2D:
         M_trks = trks2D(tx, ty, angle, 0, 0, sx, sy)
         M_trs = trs2D(tx, ty, angle, sx, sy)
         
-        np.testing.assert_array_almost_equal(M_trks, M_trs)
+        np.testing.assert_array_equal(M_trks, M_trs)
 
     def test_trks_transform_point(self):
         """Test TRKS transformation on a point."""
@@ -182,3 +239,29 @@ class TestTRKS2D:
         # Shape should be 3x3
         assert M.shape == (3, 3)
 
+
+class TestTRKS2DBatch:
+    """Tests for the vectorized trks2D_batch function."""
+
+    def test_matches_trks2D(self):
+        """Test that each matrix matches trks2D of the same parameters."""
+        tx = np.array([0, 5, -2])
+        ty = np.array([1, 3, 4])
+        angles = np.array([0, np.pi / 3, -0.7])
+        kx = np.array([0, 0.5, -0.2])
+        ky = np.array([0.1, 0, 0.6])
+        sx = np.array([1, 2, 0.5])
+        sy = np.array([1, 1.5, 3])
+
+        M = trks2D_batch(tx, ty, angles, kx, ky, sx, sy)
+
+        assert M.shape == (3, 3, 3)
+        for i in range(3):
+            np.testing.assert_array_almost_equal(M[i], trks2D(tx[i], ty[i], angles[i], kx[i], ky[i], sx[i], sy[i]))
+
+    def test_equals_trs2D_batch_when_no_shear(self):
+        """Test that a zero shear gives the TRS matrices, with scalars broadcast against arrays."""
+        M = trks2D_batch([1, 2], 0, [0.1, 0.2], 0, 0, 1, 2)
+
+        assert M.shape == (2, 3, 3)
+        np.testing.assert_array_almost_equal(M, trs2D_batch([1, 2], 0, [0.1, 0.2], 1, 2))
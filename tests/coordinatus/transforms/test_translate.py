@@ -7,6 +7,7 @@ from coordinatus.transforms import (
     translate3D
 )
 
+
 class TestTranslate2D:
     """Tests for the translate2D function."""
 
@@ -48,6 +49,24 @@ class TestTranslate2D:
         expected = np.array([1, 1, 0])  # Vector unchanged
         np.testing.assert_array_almost_equal(result, expected)
 
+    def test_translate_out(self):
+        """Test that the matrix is written into a reused buffer."""
+        out = np.full((3, 3), np.nan)
+        T = translate2D(5, -3, out=out)
+        assert T is out
+        np.testing.assert_array_equal(out, [[1, 0, 5], [0, 1, -3], [0, 0, 1]])
+
+    def test_translate2D_zero_returns_shared_identity(self):
+        """Test that a zero translation returns the shared read-only identity."""
+        T = translate2D(0, 0)
+        assert T is translate2D(0.0, 0.0)
+        assert not T.flags.writeable
+        np.testing.assert_array_equal(T, np.eye(3))
+
+        out = np.empty((3, 3))
+        assert translate2D(0, 0, out=out) is out
+        np.testing.assert_array_equal(out, np.eye(3))
+
 
 class TestTranslate:
     """Tests for the general n-dimensional translate function."""
@@ -133,6 +152,13 @@ class TestTranslate:
                             [0, 0, 1]])
         np.testing.assert_array_almost_equal(T, expected)
 
+    def test_translate_nd_out(self):
+        """Test that the N-D matrix is written into a reused buffer."""
+        out = np.full((4, 4), np.nan)
+        T = translate([1, 2, 3], out=out)
+        assert T is out
+        np.testing.assert_array_equal(out, translate3D(1, 2, 3))
+
 
 class TestTranslate3D:
     """Tests for the translate3D function."""